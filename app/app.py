@@ -2,7 +2,6 @@
 import os
 import sys
 from time import sleep
-import asyncio
 
 from dataclasses import dataclass
 from enum import Enum
@@ -46,7 +45,6 @@ class App:
 
     def __init__(self) -> None:
         self.config = AppConfig()
-        self.loop = asyncio.get_event_loop()
 
     def clear_screen(self) -> None:
         """clears the screen based on the OS"""
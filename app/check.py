@@ -65,31 +65,31 @@ def check_data():
         print("Forklift Services")
         print("-" * 17)
         difference_dfs(
-            forklift_log_df, forklift_inv_df, "Date of Service", "date", data
+            forklift_log_df(), forklift_inv_df(), "Date of Service", "date", data
         )
     elif select_services == 2:
         print("Shifting Services")
         print("-" * 17)
-        difference_dfs(shifting_log_df, shifting_inv_df, "Date Shifted", "date", data)
+        difference_dfs(shifting_log_df(), shifting_inv_df(), "Date Shifted", "date", data)
     elif select_services == 3:
         print("Transfer Services")
         print("-" * 17)
-        difference_dfs(transfer_log_df, transfer_inv_df, "Date", "date", data)
+        difference_dfs(transfer_log_df(), transfer_inv_df(), "Date", "date", data)
     elif select_services == 4:
         print("Cleaning Services")
         print("-" * 17)
-        difference_dfs(cleaning_log_df, cleaning_inv_df, "Cleaning Date", "date", data)
+        difference_dfs(cleaning_log_df(), cleaning_inv_df(), "Cleaning Date", "date", data)
     elif select_services == 5:
         print("Cross Stuffing / Unstuffing Services")
         print("-" * 27)
         difference_dfs(
-            cross_stuffing_log_df, cross_stuffing_inv_df, "Date", "date", data
+            cross_stuffing_log_df(), cross_stuffing_inv_df(), "Date", "date", data
         )
     elif select_services == 6:
         print("Pre Trip Inspection")
         print("-" * 27)
         difference_dfs(
-            pti_log_df, pti_inv_df, "Date Plug", "date", data
+            pti_log_df(), pti_inv_df(), "Date Plug", "date", data
         )
 
 
@@ -127,6 +127,54 @@ async def get_actual_df(df_function_or_object, name: str):
 
 
 
+async def resolve_dataframe(dataframe_function: Any) -> Any:
+    """Calls a dataframe builder if needed and awaits its result"""
+    if not callable(dataframe_function):
+        return dataframe_function
+    result = dataframe_function()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def collect_category_async(category_dfs: DfCollection) -> Dict[str, Any]:
+    """
+    Builds every dataframe in a category and collects the LazyFrames as one
+    Polars batch, so plans sharing a source (e.g. salt and forklift_salt) are
+    computed once.
+
+    Args:
+        category_dfs: Dataframe builders (or frames) by name
+
+    Returns:
+        The collected dataframe by name, or the exception raised building it
+    """
+    names = list(category_dfs)
+    resolved = await asyncio.gather(
+        *(resolve_dataframe(category_dfs[name]) for name in names),
+        return_exceptions=True,
+    )
+    frames: Dict[str, Any] = dict(zip(names, resolved))
+
+    lazy_names = [
+        name for name, frame in frames.items() if isinstance(frame, pl.LazyFrame)
+    ]
+    try:
+        collected = await pl.collect_all_async([frames[name] for name in lazy_names])
+        frames.update(zip(lazy_names, collected))
+    except Exception as e:
+        # One failing plan fails the whole batch; collect the frames one by one
+        # so the others are still saved and the failure is reported by name
+        logger.error("Batch collect failed, collecting separately: %s", str(e))
+        for name in lazy_names:
+            try:
+                frames[name] = await frames[name].collect_async()
+            except Exception as err:
+                frames[name] = err
+
+    return frames
+
+
 async def save_to_csv_async(dataframe_info: DataframeInfo) -> SaveResult:
     """Process the dataframes to CSV file asynchronously"""
     if not isinstance(dataframe_info, tuple) or len(dataframe_info) != 2:
@@ -134,6 +182,11 @@ async def save_to_csv_async(dataframe_info: DataframeInfo) -> SaveResult:
 
     dataframe_name, dataframe_function = dataframe_info
 
+    # Builders that failed while their category was collected
+    if isinstance(dataframe_function, Exception):
+        logger.error("Error processing dataframe %s: %s", dataframe_name, str(dataframe_function))
+        return dataframe_name, dataframe_function
+
     try:
         # Add explicit path and ensure directory exists
         output_path = f"output/csv/{dataframe_name}.csv"
@@ -157,8 +210,13 @@ async def save_to_csv_async(dataframe_info: DataframeInfo) -> SaveResult:
             else:
                 actual_dataframe = dataframe_function
 
-            # Now we should have the actual dataframe - check if it needs to be collected
-            if hasattr(actual_dataframe, 'collect'):
+            # Now we should have the actual dataframe - check if it needs to be collected.
+            # LazyFrames are collected off the event loop so the concurrent saves
+            # run their plans in parallel on the Polars thread pool
+            if isinstance(actual_dataframe, pl.LazyFrame):
+                logger.info("Collecting LazyFrame for %s", dataframe_name)
+                collected_df = await actual_dataframe.collect_async()
+            elif hasattr(actual_dataframe, 'collect'):
                 logger.info("Collecting LazyFrame for %s", dataframe_name)
                 collected_df = actual_dataframe.collect()
             else:
@@ -215,10 +273,15 @@ async def save_df_to_csv_async(dataframes: Optional[str] = None) -> None:
         # Process all dictionaries concurrently
         logger.info("Processing all dataframe categories concurrently")
 
+        # Each category is collected as one batch; categories run concurrently
+        collected_categories = await asyncio.gather(
+            *(collect_category_async(category_dfs) for category_dfs in df_dict.values())
+        )
+
         all_tasks = []
-        for category, category_dfs in df_dict.items():
+        for category, category_frames in zip(df_dict, collected_categories):
             logger.info("Queueing category: %s", category)
-            for name, df in category_dfs.items():
+            for name, df in category_frames.items():
                 all_tasks.append(save_to_csv_async((name, df)))
 
         # Execute all tasks concurrently with a reasonable concurrency limit
@@ -269,8 +332,9 @@ async def save_df_to_csv_async(dataframes: Optional[str] = None) -> None:
     logger.info("Processing dataframe category: %s", dataframes)
     logger.info("Processing dataframes: %s", list(data.keys()))
 
-    # Process each dataframe concurrently
-    tasks = [save_to_csv_async((name, df)) for name, df in data.items()]
+    # Collect the category as one batch, then write each dataframe concurrently
+    frames = await collect_category_async(data)
+    tasks = [save_to_csv_async((name, df)) for name, df in frames.items()]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Process results
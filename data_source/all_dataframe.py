@@ -9,7 +9,7 @@ from data_source.sheet_ids import (
     BY_CATCH_SHEET,
     CCCS_STUFFING_SHEET
 )
-from type_casting.dates import CURRENT_YEAR, DAY_NAMES, DayName
+from type_casting.dates import DAY_NAMES, PUBLIC_HOLIDAYS, DayName
 from type_casting.validations import FISH_STORAGE
 from type_casting.containers import containers_enum
 
@@ -64,7 +64,7 @@ async def by_catch_transfer()->pl.LazyFrame:
     df.with_columns(
         date=pl.col("date").str.to_date(format="%d/%m/%Y"),
     ).with_columns(
-        day=pl.when(pl.col("date").is_in(DayName.public_holiday_series(CURRENT_YEAR)))
+        day=pl.when(pl.col("date").is_in(PUBLIC_HOLIDAYS))
         .then(pl.lit(DayName.PH.value))
         .otherwise(pl.col("date").dt.to_string(format="%a")).cast(dtype=pl.Enum(DAY_NAMES))
     )
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 # Cache for loaded datasets to avoid redundant requests
 data_cache: Dict[str, pl.LazyFrame] = {}
 
+# Requests still in flight, so concurrent callers for one sheet share a fetch
+_pending_loads: Dict[str, asyncio.Task] = {}
+
 async def load_gsheet_data(sheet_id: str, sheet_name: str) -> pl.LazyFrame:
     """
     Loads a Google Sheet as a Polars LazyFrame asynchronously.
@@ -31,6 +34,18 @@ async def load_gsheet_data(sheet_id: str, sheet_name: str) -> pl.LazyFrame:
         logger.info("Using cached data for %s", sheet_name)
         return data_cache[cache_key]
 
+    # Join the fetch already running for this sheet, or start one
+    task = _pending_loads.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_gsheet_data(sheet_id, sheet_name, cache_key))
+        _pending_loads[cache_key] = task
+        task.add_done_callback(lambda _: _pending_loads.pop(cache_key, None))
+
+    # Shield so one cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(task)
+
+async def _fetch_gsheet_data(sheet_id: str, sheet_name: str, cache_key: str) -> pl.LazyFrame:
+    """Fetches a sheet as CSV and caches the LazyFrame under cache_key"""
     link: str = "https://docs.google.com/spreadsheets"
     url: str = f"{link}/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
 
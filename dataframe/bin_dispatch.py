@@ -16,7 +16,7 @@ from type_casting.dates import (
     SPECIAL_DAYS,
     UPPER_BOUND,
     UPPER_BOUND_SPECIAL_DAY,
-    DayName,
+    PUBLIC_HOLIDAYS,
     CURRENT_YEAR,
 )
 from type_casting.validations import (
@@ -28,7 +28,7 @@ from type_casting.validations import (
 )
 
 # Prepare the list of Public Holiday dates in the Current Year
-ph_list: pl.Series = DayName.public_holiday_series()
+ph_list: list[date] = PUBLIC_HOLIDAYS
 
 
 # Price
@@ -8,7 +8,7 @@ from polars import lit, LazyFrame, when, col, Enum, Utf8
 from data.price import OVERTIME_150, FREE, get_price
 from data_source.make_dataset import load_gsheet_data
 from data_source.sheet_ids import EMR_SHEET_ID, shifting_sheet, pti_sheet, washing_sheet
-from type_casting.dates import SPECIAL_DAYS, DayName
+from type_casting.dates import SPECIAL_DAYS, PUBLIC_HOLIDAYS, DayName
 from type_casting.validations import SetPoint, SETPOINTS
 from type_casting.containers import containers_enum
 
@@ -31,41 +31,41 @@ async def price_list() -> dict[str, float]:
 
     magnum_pti_electricity = (
         price.filter(pl.col("Service").eq(pl.lit("PTI Magnum")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     plugin = (
         price.filter(pl.col("Service").eq(pl.lit("Plugin")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     s_freezer_pti_electricity = (
         price.filter(pl.col("Service").eq(pl.lit("PTI S Freezer")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
     shifting_price = (
         price.filter(pl.col("Service").eq(pl.lit("Shifting")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
     standard_pti_electricity = (
         price.filter(pl.col("Service").eq(pl.lit("PTI Standard")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
     washing_price = (
         price.filter(pl.col("Service").eq(pl.lit("Container Cleaning")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     return {
@@ -94,7 +94,7 @@ async def shifting() -> LazyFrame:
     return (
         df.with_columns(date=pl.col("date").str.to_date(format="%d/%m/%Y"))
         .with_columns(
-            day_name=when(col("date").is_in(DayName.public_holiday_series()))
+            day_name=when(col("date").is_in(PUBLIC_HOLIDAYS))
             .then(lit(DayName.PH.value))
             .otherwise(col("date").dt.strftime("%a"))
         )
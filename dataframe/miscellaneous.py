@@ -53,9 +53,9 @@ async def price_list() -> dict[str, float | pl.LazyFrame]:
 
     cccs_movement_fee = (
         price.filter(pl.col("Service").eq(pl.lit("CCCS Movement in/out")))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     cross_stuffing_price = price.filter(
@@ -1,6 +1,7 @@
 """NetList Lazyframes"""
 
-# from datetime import date
+from datetime import date
+import asyncio
 import polars as pl
 from data_source.all_dataframe import miscellaneous
 from data_source.make_dataset import load_gsheet_data
@@ -14,7 +15,7 @@ from data_source.sheet_ids import (
 )
 from type_casting.dates import (
     SPECIAL_DAYS,
-    DayName,
+    PUBLIC_HOLIDAYS,
 )
 from type_casting.validations import (
     FISH_STORAGE,
@@ -29,7 +30,7 @@ from type_casting.customers import get_customer_by_type
 from dataframe.stuffing import coa
 from data.price import FREE, get_price
 
-ph_list: pl.Series = DayName.public_holiday_series()
+ph_list: list[date] = PUBLIC_HOLIDAYS
 
 
 # Price
@@ -86,11 +87,10 @@ by_catch_companies: list[str] = [
 
 
 # Container Stuffing Type
-async def stuffing_type() -> pl.LazyFrame:
+def stuffing_type(coa_df: pl.LazyFrame) -> pl.LazyFrame:
     """Container Stuffing Type"""
-    df = await coa()
     return (
-        df.select(
+        coa_df.select(
             pl.col(
                 [
                     "vessel_client",
@@ -121,12 +121,11 @@ async def stuffing_type() -> pl.LazyFrame:
 
 
 # CCCS record from the Miscellaneous Activity
-async def cccs_record() -> pl.LazyFrame:
+def cccs_record(misc_df: pl.LazyFrame) -> pl.LazyFrame:
     """CCCS record from the Misc Activity"""
-    df = await miscellaneous()
     return (
         (
-            df.filter(
+            misc_df.filter(
                 pl.col("operation_type").is_in(UNLOADING_SERVICE),
                 ~pl.col("customer").is_in(by_catch_companies),
             )
@@ -153,14 +152,10 @@ async def cccs_record() -> pl.LazyFrame:
 
 
 # .str.to_date(format="%d/%m/%Y")
-async def cccs_adjusted_records() -> pl.LazyFrame:
+def cccs_adjusted_records(raw_df: pl.LazyFrame, cccs: pl.LazyFrame) -> pl.LazyFrame:
     """CCCs adjusted records"""
-
-    df = await load_gsheet_data(OPS_SHEET_ID, raw_sheet)
-    cccs = await cccs_record()
-
     return (
-        df.filter(pl.col("Container (Destination)").str.contains(pl.lit("CCCS")))
+        raw_df.filter(pl.col("Container (Destination)").str.contains(pl.lit("CCCS")))
         .select(
             pl.col("Day"),
             pl.col("Date").str.to_date(format="%d/%m/%Y").alias("date"),
@@ -241,23 +236,19 @@ async def cccs_adjusted_records() -> pl.LazyFrame:
 # The Net List
 
 
-async def net_list() -> pl.LazyFrame:
-    """The net list dataset"""
-    df = await load_gsheet_data(OPS_SHEET_ID, net_list_sheet)
-    df_cccs_adjusted = await cccs_adjusted_records()
-    price = await price_list()
-    unloading_price = price.get("unloading_price")
-    stuffing_type_df = await stuffing_type()
-
-    iot_enum = await iot_soc_enum()
-
-    customer = await get_customer_by_type()
-    cargo = customer.get("cargo")
-
+def build_net_list(
+    net_list_df: pl.LazyFrame,
+    df_cccs_adjusted: pl.LazyFrame,
+    stuffing_type_df: pl.LazyFrame,
+    unloading_price: pl.LazyFrame,
+    iot_enum: list[str],
+    cargo: list[str],
+) -> pl.LazyFrame:
+    """The net list dataset built from already loaded sheets"""
     return (
         pl.concat(
             [
-                df.filter(
+                net_list_df.filter(
                     ~pl.col("Container (Destination)").str.contains(pl.lit("CCCS"))
                 ).select(
                     pl.col("Date").str.to_date(format="%d/%m/%Y").alias("date"),
@@ -333,15 +324,34 @@ async def net_list() -> pl.LazyFrame:
     )
 
 
-# Maersk OSS stuffing list ; Separated between Full and Basic OSS
-async def oss() -> pl.LazyFrame:
-    """oss dataset"""
+async def net_list() -> pl.LazyFrame:
+    """The net list dataset"""
+    # The sheets are independent, so fetch them concurrently
+    df, raw_df, misc_df, coa_df, price, iot_enum, customer = await asyncio.gather(
+        load_gsheet_data(OPS_SHEET_ID, net_list_sheet),
+        load_gsheet_data(OPS_SHEET_ID, raw_sheet),
+        miscellaneous(),
+        coa(),
+        price_list(),
+        iot_soc_enum(),
+        get_customer_by_type(),
+    )
 
-    df = await net_list()
-    price = await price_list()
-    oss_price = price.get("oss_stuffing_price")
+    return build_net_list(
+        net_list_df=df,
+        df_cccs_adjusted=cccs_adjusted_records(raw_df, cccs_record(misc_df)),
+        stuffing_type_df=stuffing_type(coa_df),
+        unloading_price=price.get("unloading_price"),
+        iot_enum=iot_enum,
+        cargo=customer.get("cargo"),
+    )
+
+
+# Maersk OSS stuffing list ; Separated between Full and Basic OSS
+def build_oss(net_list_df: pl.LazyFrame, oss_price: pl.LazyFrame) -> pl.LazyFrame:
+    """oss dataset built from the net list"""
     return (
-        df.select(pl.all().exclude(["Price", "invoice_value"]))
+        net_list_df.select(pl.all().exclude(["Price", "invoice_value"]))
         .filter(pl.col("service").str.contains("OSS"))
         .with_columns(
             Service=pl.when(pl.col("service").eq(pl.lit("Full OSS")))
@@ -366,13 +376,17 @@ async def oss() -> pl.LazyFrame:
     )
 
 
+async def oss() -> pl.LazyFrame:
+    """oss dataset"""
+    df, price = await asyncio.gather(net_list(), price_list())
+    return build_oss(df, price.get("oss_stuffing_price"))
+
+
 # Create an IOT list of containers stuffed on IOT account.
-async def iot_coa() -> pl.LazyFrame:
+def iot_coa(coa_df: pl.LazyFrame) -> pl.LazyFrame:
     """IOT stuffing and plugin data set"""
-
-    df = await coa()
     return (
-        df.with_columns(
+        coa_df.with_columns(
             pl.col("vessel_client").cast(pl.Utf8),
             pl.col("container_number").cast(pl.Utf8),
         )
@@ -395,21 +409,17 @@ async def iot_coa() -> pl.LazyFrame:
 
 
 # IOT SOC Stuffing DataFrame
-async def iot_stuffing() -> pl.LazyFrame:
-    """IOT SOC dataset"""
-
-    df = await load_gsheet_data(OPS_SHEET_ID, net_list_sheet)
-
-    iot_df = await iot_coa()
-
-    iot_soc = await iot_soc_enum()
-    price = await price_list()
-    stuffing_price = price.get("stuffing_price")
-
+def build_iot_stuffing(
+    net_list_df: pl.LazyFrame,
+    iot_df: pl.LazyFrame,
+    iot_soc: list[str],
+    stuffing_price: pl.LazyFrame,
+) -> pl.LazyFrame:
+    """IOT SOC dataset built from already loaded sheets"""
     get_iot_containers: pl.Expr = pl.col("container_number").is_in(iot_soc)
 
     return (
-        df.select(
+        net_list_df.select(
             pl.col("Date").str.to_date(format="%d/%m/%Y").alias("date"),
             pl.col("Vessel").str.to_uppercase().alias("vessel"),
             pl.col("startTime").str.to_time(format="%H:%M:%S").alias("start_time"),
@@ -469,3 +479,20 @@ async def iot_stuffing() -> pl.LazyFrame:
         .filter(pl.col("customer").eq(pl.lit("IOT")))
         .select(pl.col("*").exclude(["customer"]))
     )
+
+
+async def iot_stuffing() -> pl.LazyFrame:
+    """IOT SOC dataset"""
+    df, coa_df, iot_soc, price = await asyncio.gather(
+        load_gsheet_data(OPS_SHEET_ID, net_list_sheet),
+        coa(),
+        iot_soc_enum(),
+        price_list(),
+    )
+
+    return build_iot_stuffing(
+        net_list_df=df,
+        iot_df=iot_coa(coa_df),
+        iot_soc=iot_soc,
+        stuffing_price=price.get("stuffing_price"),
+    )
@@ -1,13 +1,14 @@
 """Operations Lazyframe for parquet storage only"""
 
 # from pathlib import Path
+import asyncio
 import polars as pl
 from data_source.make_dataset import load_gsheet_data
 from data_source.sheet_ids import OPS_SHEET_ID, raw_sheet, WELL_TO_WELL
 from type_casting.validations import FISH_STORAGE
 from type_casting.validations import OvertimePerc
 
-from type_casting.dates import SPECIAL_DAYS, DayName, DAY_NAMES
+from type_casting.dates import SPECIAL_DAYS, PUBLIC_HOLIDAYS, DayName, DAY_NAMES
 
 # from dataframe import invoice
 
@@ -19,8 +20,13 @@ from data.price import get_price
 
 # EXTRAMEN: float = get_price(["Extra Men"]).with_columns(date=pl.col("Date"))
 # Price
-async def price_list() -> dict[str, float | pl.LazyFrame]:
-    """price dictionary"""
+# Prices rarely change, so they are fetched once per process
+_price_cache: dict[str, float | str | pl.DataFrame] = {}
+_price_lock = asyncio.Lock()
+
+
+async def _load_price_list() -> dict[str, float | str | pl.DataFrame]:
+    """Loads the prices from the price sheet"""
 
     # liner_price = await (
     #     get_price(["Plastic Liner Installation"])
@@ -33,15 +39,36 @@ async def price_list() -> dict[str, float | pl.LazyFrame]:
         "Well to Well Transfer"
     ])
 
-    well_to_well_price: pl.LazyFrame =price.filter(pl.col("Service").eq(
-        "Well to Well Transfer"
-    )).with_columns(date=pl.col("Date"))
+    well_to_well_price: pl.DataFrame = (
+        price.filter(pl.col("Service").eq("Well to Well Transfer"))
+        .with_columns(date=pl.col("Date"))
+        .collect()
+    )
+
+    # A single rate is broadcast as a scalar instead of an asof join
+    if well_to_well_price.height == 1:
+        return {
+            "well_to_well_price": well_to_well_price["Price"][0],
+            "well_to_well_since": well_to_well_price["date"][0],
+        }
 
+    # Otherwise keep the small table eager and sorted, ready for the asof join.
+    # It only holds the one service, so the join needs no by="Service" group
     return {
-        "well_to_well_price": well_to_well_price,
+        "well_to_well_price": well_to_well_price.select(["date", "Price"]).sort(
+            by="date"
+        ),
     }
 
 
+async def price_list() -> dict[str, float | str | pl.DataFrame]:
+    """price dictionary"""
+    async with _price_lock:
+        if not _price_cache:
+            _price_cache.update(await _load_price_list())
+    return _price_cache.copy()
+
+
 # TARE_RATE: pl.LazyFrame = get_price(
 #     ["Rental of Calibration", "Tare Calibration"]
 # ).with_columns(date=pl.col("Date"))
@@ -69,11 +96,15 @@ async def ops() -> pl.LazyFrame:
         pl.col("Vessel").str.to_uppercase(),
         pl.col("Species").str.extract(r"^(.*?)(\s-\s)"),
         pl.col("Details").str.to_uppercase(),
-        pl.col("Scale Reading(-Fish Net) (Cal)")
-        .str.replace(",", "")
-        .cast(pl.Int64)
-        .alias("tonnage")
-        * 0.001,
+        # Readings come in as "12,345" (kg); the cast to String covers sheets
+        # where every reading is small enough for the CSV reader to infer ints
+        (
+            pl.col("Scale Reading(-Fish Net) (Cal)")
+            .cast(pl.String)
+            .str.replace_all(",", "", literal=True)
+            .cast(pl.Float64)
+            * 0.001
+        ).alias("tonnage"),
         pl.col("Storage").cast(dtype=pl.Enum(FISH_STORAGE)),
         pl.col("Container (Destination)").alias("destination"),
         pl.col("overtime"),
@@ -85,7 +116,7 @@ def add_day_name_column(date_col: pl.Expr) -> pl.Expr:
     """adds the day name based on the date column name this includes public holiday (PH)"""
 
     return (
-        pl.when(date_col.is_in(DayName.public_holiday_series()))
+        pl.when(date_col.is_in(PUBLIC_HOLIDAYS))
         .then(pl.lit(DayName.PH.value))
         .otherwise(date_col.dt.to_string(format="%a"))
     ).cast(dtype=pl.Enum(DAY_NAMES))
@@ -152,10 +183,12 @@ def add_day_name_column(date_col: pl.Expr) -> pl.Expr:
 
 async def hatch_to_hatch() -> pl.LazyFrame:
     """Well to Well transfer"""
-    df = await load_gsheet_data(sheet_id=OPS_SHEET_ID, sheet_name=WELL_TO_WELL)
-    price = await price_list()
+    df, price = await asyncio.gather(
+        load_gsheet_data(sheet_id=OPS_SHEET_ID, sheet_name=WELL_TO_WELL),
+        price_list(),
+    )
     well_to_well = price.get("well_to_well_price")
-    return (
+    transfers = (
         df.select(
             pl.col("Day").alias("day_name"),
             pl.col("Date").alias("date"),
@@ -164,8 +197,19 @@ async def hatch_to_hatch() -> pl.LazyFrame:
         )
         .with_columns(Service=pl.lit("Well to Well Transfer"))
         .sort(by="date")
-        .join_asof(well_to_well.sort(by="date"), by="Service", on="date", strategy="backward")
-        .with_columns(
+    )
+    if isinstance(well_to_well, pl.DataFrame):
+        transfers = transfers.join_asof(
+            well_to_well.lazy(), on="date", strategy="backward"
+        )
+    else:
+        transfers = transfers.with_columns(
+            Price=pl.when(
+                pl.col("date") >= pl.lit(price.get("well_to_well_since"))
+            ).then(pl.lit(well_to_well))
+        )
+    return (
+        transfers.with_columns(
             total_price=pl.when(pl.col("day_name").is_in(SPECIAL_DAYS))
             .then(
                 OvertimePerc.overtime_150
@@ -1,7 +1,7 @@
 """Shore handling Lazyframe"""
 
 from typing import List
-from datetime import date
+import asyncio
 import polars as pl
 
 from data_source.make_dataset import load_gsheet_data
@@ -10,13 +10,16 @@ from type_casting.customers import get_customer_by_type, ship_owner
 from type_casting.validations import MOVEMENT_TYPE, OvertimePerc
 from type_casting.dates import (
     SPECIAL_DAYS,
-    UPPER_BOUND,
-    UPPER_BOUND_SPECIAL_DAY,
+    UPPER_BOUND_SECONDS,
+    UPPER_BOUND_SPECIAL_DAY_SECONDS,
+    SECONDS_IN_A_DAY,
     DAY_NAMES,
     MORNING_CUTOFF,
     NULL_DURATION,
+    PUBLIC_HOLIDAYS,
     DayName,
-    duration_to_hhmm
+    duration_to_hhmm,
+    weekday_name,
 )
 
 # from data_source import expressions as exp
@@ -24,8 +27,13 @@ from data.price import get_price
 
 
 # Price
-async def price_list() -> dict[str, float | pl.LazyFrame]:
-    """price dictionary"""
+# Prices rarely change, so they are fetched once per process
+_price_cache: dict[str, float | pl.LazyFrame] = {}
+_price_lock = asyncio.Lock()
+
+
+async def _load_price_list() -> dict[str, float | pl.LazyFrame]:
+    """Loads the prices from the price sheet"""
 
     price = await get_price(
         [
@@ -37,154 +45,69 @@ async def price_list() -> dict[str, float | pl.LazyFrame]:
 
     bin_tipping_price: pl.Float32 = (
         price.filter(pl.col("Service").eq("CCCS Movement in/out"))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     salt_price: pl.Float32 = (
         price.filter(
             pl.col("Service").is_in(["Loading (Quay to Ship)", "Loading @ Zone 14"])
         )
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
 
     return {"bin_tipping_price": bin_tipping_price, "salt_price": salt_price}
 
 
-ph_list: List[date] = DayName.public_holiday_series()
+async def price_list() -> dict[str, float | pl.LazyFrame]:
+    """price dictionary"""
+    async with _price_lock:
+        if not _price_cache:
+            _price_cache.update(await _load_price_list())
+    return _price_cache.copy()
 
 
 is_special_day = pl.col("day_name").is_in(SPECIAL_DAYS)
 
-is_not_special_day = ~is_special_day
-
-# Condition for Duration Calculation
-# For Normal Days
-before_cut_off_normal_day = (pl.col("end_time") < UPPER_BOUND) & (
-    pl.col("start_time") < UPPER_BOUND
-)
-end_time_after_cut_off = (pl.col("end_time") > UPPER_BOUND) & (
-    pl.col("start_time") < UPPER_BOUND
-)  # rename variable: is_end_time_after_cut_off
-
-start_after_cut_off_normal_day = (pl.col("end_time") > UPPER_BOUND) & (
-    pl.col("start_time") >= UPPER_BOUND
-)
-
-stop_after_cut_off_normal_day = (pl.col("end_time") > UPPER_BOUND) & (
-    pl.col("start_time") < UPPER_BOUND
-)
-
-
-# Coditional for Overtime Days
-
-start_after_cut_off_special_day = (pl.col("end_time") > UPPER_BOUND_SPECIAL_DAY) & (
-    pl.col("start_time") >= UPPER_BOUND_SPECIAL_DAY
-)
-
-stop_after_cut_off_special_day = (pl.col("end_time") > UPPER_BOUND_SPECIAL_DAY) & (
-    pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY
-)
-
-
-stop_before_cut_off_special_day = (pl.col("end_time") <= UPPER_BOUND_SPECIAL_DAY) & (
-    pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY
-)
-
 after_midnight = (pl.col("end_time") < pl.col("start_time")) & (
     pl.col("end_time") <= MORNING_CUTOFF
 )
 
+# Start and end as seconds since midnight of the service date; an end after
+# midnight is pushed onto the next day so every service is one interval
+start_seconds = pl.col("start_time").cast(pl.Int64) // 1_000_000_000
+end_seconds = pl.col("end_time").cast(pl.Int64) // 1_000_000_000 + pl.when(
+    pl.col("_after_mid")
+).then(SECONDS_IN_A_DAY).otherwise(0)
 
-# Durations based on the conditionals
-
-hours_after_cut_off_normal_day = pl.col("date").dt.combine(pl.col("end_time")) - pl.col(
-    "date"
-).dt.combine(UPPER_BOUND)
+# Helper columns added by _salt_base and dropped before returning
+SALT_HELPER_COLUMNS: List[str] = ["_special", "_after_mid", "_start", "_end"]
 
-hours_after_cut_off_special_day = pl.col("date").dt.combine(
-    pl.col("end_time")
-) - pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
+# Whole service duration, spanning midnight where needed
+durations = pl.duration(seconds=pl.col("_end") - pl.col("_start"))
 
-normal_duration_special_day = pl.col("date").dt.combine(
-    UPPER_BOUND_SPECIAL_DAY
-) - pl.col("date").dt.combine(pl.col("start_time"))
-
-normal_duration = pl.col("date").dt.combine(UPPER_BOUND) - pl.col("date").dt.combine(
-    pl.col("start_time")
-)
-
-# Duration only for the portion after midnight
-midnight_time = pl.lit(
-    0
-)  # Midnight in seconds (assuming time is in seconds since midnight)
-duration_after_midnight = (
-    pl.col("date").dt.combine(pl.col("end_time")) + pl.duration(days=1)
-) - (pl.col("date") + pl.duration(days=1)).dt.combine(midnight_time)
-
-durations = pl.col("date").dt.combine(pl.col("end_time")) - pl.col("date").dt.combine(
-    pl.col("start_time")
-)
 
-# # Define after_midnight condition and duration calculation
-# after_midnight = pl.col("end_time") < pl.col("start_time")
-
-# Duration that spans midnight (for total duration)
-duration_after_midnight = (pl.col("date") + pl.duration(days=1)).dt.combine(
-    pl.col("end_time")
-) - pl.col("date").dt.combine(pl.col("start_time"))
-
-# For normal days with service crossing midnight
-# Before upper bound portion (normal rate)
-before_upper_bound_portion = (
-    pl.when(after_midnight & is_not_special_day & (pl.col("start_time") < UPPER_BOUND))
-    .then(
-        pl.col("date").dt.combine(UPPER_BOUND)
-        - pl.col("date").dt.combine(pl.col("start_time"))
+def portion(lower: int, upper: int | None = None) -> pl.Expr:
+    """Duration of the service falling between lower and upper (in seconds)"""
+    end = pl.col("_end") if upper is None else pl.min_horizontal("_end", upper)
+    return pl.duration(
+        seconds=(end - pl.max_horizontal(pl.col("_start"), lower)).clip(lower_bound=0)
     )
-    .otherwise(pl.duration())
-)
 
-# After upper bound until midnight portion (150% rate)
-after_upper_bound_until_midnight = (
-    pl.when(after_midnight & is_not_special_day & (pl.col("start_time") < UPPER_BOUND))
-    .then(
-        (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
-        - pl.col("date").dt.combine(UPPER_BOUND)
-    )
-    .when(after_midnight & is_not_special_day & (pl.col("start_time") >= UPPER_BOUND))
-    .then(
-        (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
-        - pl.col("date").dt.combine(pl.col("start_time"))
-    )
-    .otherwise(pl.duration())
-)
 
-# After midnight portion (200% rate for normal days, moved to overtime_200)
-portion_after_midnight = (
-    pl.when(after_midnight)
-    .then(
-        (pl.col("date") + pl.duration(days=1)).dt.combine(pl.col("end_time"))
-        - (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
+async def _salt_base(exclude_operation_type: str | None = None) -> pl.LazyFrame:
+    """Parsed salt sheet with the helper columns both salt datasets share"""
+    df, customer, ship_owners = await asyncio.gather(
+        load_gsheet_data(sheet_id=SHORE_HANDLING_ID, sheet_name=SALT_SHEET),
+        get_customer_by_type(),
+        ship_owner(),
     )
-    .otherwise(pl.duration())
-)
-
-
-
-async def salt() -> pl.LazyFrame:
-    """salt dataset"""
-    df = await load_gsheet_data(sheet_id=SHORE_HANDLING_ID, sheet_name=SALT_SHEET)
-
-    price = await price_list()
-    salt_price = price.get("salt_price")
-
-    customer = await get_customer_by_type()
     purseiner = customer.get("purseiner")
-    ship_owners = await ship_owner()
+    if exclude_operation_type is not None:
+        df = df.filter(pl.col("operation_type").ne(pl.lit(exclude_operation_type)))
     return (
         df.select(
             pl.col("day_name").cast(dtype=pl.Enum(DAY_NAMES)),
@@ -196,262 +119,90 @@ async def salt() -> pl.LazyFrame:
             pl.col("duration"),
             pl.col("operation_type"),
             pl.col("tonnage").cast(pl.Float64),
-        ).with_columns(
-        # Normal rate calculation
-        normal=pl.when(after_midnight & is_not_special_day)
-        .then(before_upper_bound_portion)
-        .when(is_not_special_day & end_time_after_cut_off & ~after_midnight)
-        .then(normal_duration)
-        .when(is_not_special_day & before_cut_off_normal_day & ~after_midnight)
-        .then(durations)
-        .otherwise(pl.duration()),
-        # 150% rate calculation - only until midnight for normal days
-        normal_150=pl.when(after_midnight & is_not_special_day)
-        .then(after_upper_bound_until_midnight)  # Only until midnight
-        .when(is_not_special_day & start_after_cut_off_normal_day & ~after_midnight)
-        .then(durations)
-        .when(is_not_special_day & stop_after_cut_off_normal_day & ~after_midnight)
-        .then(hours_after_cut_off_normal_day)
-        .otherwise(pl.duration()),
-        # Special days at 150%
-        sun_150=pl.when(
-            is_special_day & stop_after_cut_off_special_day & ~after_midnight
-        )
-        .then(normal_duration_special_day)
-        .when(is_special_day & stop_before_cut_off_special_day & ~after_midnight)
-        .then(durations)
-        .when(
-            is_special_day
-            & after_midnight
-            & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
         )
-        .then(
-            pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .otherwise(pl.duration()),
-        # 200% overtime - including after midnight for normal days
-        overtime_200=pl.when(
-            is_special_day & start_after_cut_off_special_day & ~after_midnight
-        )
-        .then(durations)
-        .when(is_special_day & stop_after_cut_off_special_day & ~after_midnight)
-        .then(hours_after_cut_off_special_day)
-        .when(is_special_day & after_midnight)
-        .then(
-            pl.when(pl.col("start_time") >= UPPER_BOUND_SPECIAL_DAY)
-            .then(duration_after_midnight)
-            .otherwise(
-                (pl.col("date") + pl.duration(days=1)).dt.combine(pl.col("end_time"))
-                - pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-            )
-        )
-        .when(
-            is_not_special_day & after_midnight
-        )  # Add this crucial condition for normal days
-        .then(
-            portion_after_midnight
-        )  # After midnight portion goes to 200% for normal days
-        .otherwise(pl.duration()),
-        # Add durations column for after midnight case
-        total_duration=pl.when(after_midnight)
-        .then(duration_after_midnight)
-        .otherwise(durations),
+        # Evaluate the day and midnight tests once per row, not once per branch
+        .with_columns(_special=is_special_day, _after_mid=after_midnight)
+        .with_columns(_start=start_seconds, _end=end_seconds)
+    )
+
+
+async def salt() -> pl.LazyFrame:
+    """salt dataset"""
+    df, price = await asyncio.gather(_salt_base(), price_list())
+    salt_price = price.get("salt_price")
+    # Fold the rate multipliers into the price once, outside the row maths
+    normal_rate = salt_price * OvertimePerc.normal_hour
+    overtime_150_rate = salt_price * OvertimePerc.overtime_150
+    overtime_200_rate = salt_price * OvertimePerc.overtime_200
+    return (
+        df.with_columns(
+        # Normal rate until the cut-off, 150% until midnight on normal days
+        normal=pl.when(pl.col("_special"))
+        .then(NULL_DURATION)
+        .otherwise(portion(0, UPPER_BOUND_SECONDS)),
+        normal_150=pl.when(pl.col("_special"))
+        .then(NULL_DURATION)
+        .otherwise(portion(UPPER_BOUND_SECONDS, SECONDS_IN_A_DAY)),
+        # Special days at 150% until the special day cut-off
+        sun_150=pl.when(pl.col("_special"))
+        .then(portion(0, UPPER_BOUND_SPECIAL_DAY_SECONDS))
+        .otherwise(NULL_DURATION),
+        # 200% overtime - after the special day cut-off, or after midnight
+        overtime_200=pl.when(pl.col("_special"))
+        .then(portion(UPPER_BOUND_SPECIAL_DAY_SECONDS))
+        .otherwise(portion(SECONDS_IN_A_DAY)),
+        # Tonnage handled per second of service, to split it across the bands
+        _tonnage_per_second=pl.col("tonnage") / (pl.col("_end") - pl.col("_start")),
     )
     .with_columns(
-        # Calculate weighted values by tonnage, using total_duration for after midnight cases
-        normal=(
-            pl.col("normal")
-            / pl.when(after_midnight)
-            .then(pl.col("total_duration"))
-            .otherwise(durations)
-        )
-        * pl.col("tonnage"),
-        overtime_150=(
-            pl.col("normal_150")
-            / pl.when(after_midnight)
-            .then(pl.col("total_duration"))
-            .otherwise(durations)
-        )
-        * pl.col("tonnage")
-        + (
-            pl.col("sun_150")
-            / pl.when(after_midnight)
-            .then(pl.col("total_duration"))
-            .otherwise(durations)
-        )
-        * pl.col("tonnage"),
-        overtime_200=(
-            pl.col("overtime_200")
-            / pl.when(after_midnight)
-            .then(pl.col("total_duration"))
-            .otherwise(durations)
-        )
-        * pl.col("tonnage"),
+        # Weight the tonnage by the seconds falling in each band
+        normal=pl.col("normal").dt.total_seconds() * pl.col("_tonnage_per_second"),
+        overtime_150=(pl.col("normal_150") + pl.col("sun_150")).dt.total_seconds()
+        * pl.col("_tonnage_per_second"),
+        overtime_200=pl.col("overtime_200").dt.total_seconds()
+        * pl.col("_tonnage_per_second"),
     )
+    # The bands and helpers are spent once the weights exist
+    .drop(["normal_150", "sun_150", "_tonnage_per_second", *SALT_HELPER_COLUMNS])
     .with_columns(
-        price=(pl.col("normal") * salt_price * OvertimePerc.normal_hour)
-        + (pl.col("overtime_150") * salt_price * OvertimePerc.overtime_150)
-        + (pl.col("overtime_200") * salt_price * OvertimePerc.overtime_200)
+        price=(pl.col("normal") * normal_rate)
+        + (pl.col("overtime_150") * overtime_150_rate)
+        + (pl.col("overtime_200") * overtime_200_rate)
     )
-    .select(pl.all().exclude(["normal_150", "sun_150", "total_duration"]))
 
 )
 
 async def forklift_salt()-> pl.LazyFrame:
     """Forklift Salt Operations"""
-    df = await salt()
+    # Zone 14 loading is dropped before the salt overtime is worked out
+    df = await _salt_base(exclude_operation_type="Loading @ Zone 14")
     result= (
-        df.filter(
-    pl.col("operation_type").ne(pl.lit("Loading @ Zone 14"))
-).select(
+        df.select(
         pl.col("day_name").alias("day"),
         pl.col("date"),
         pl.col("vessel"),
         pl.col("start_time"),
         pl.col("end_time"),
+        *SALT_HELPER_COLUMNS,
     ).with_columns(
         # Calculate total duration accounting for after midnight services
-        total_duration=pl.when(after_midnight)
-        .then(duration_after_midnight)
-        .otherwise(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        ),
-        # Overtime for normal services (non-special days)
-        overtime_for_normal_services=pl.when(
-            # After midnight on normal days - handle portion before midnight
-            (after_midnight)
-            & (~pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("start_time") > UPPER_BOUND)
-        )
-        .then(
-            (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .when(
-            (after_midnight)
-            & (~pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("start_time") <= UPPER_BOUND)
-        )
-        .then(
-            (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
-            - pl.col("date").dt.combine(UPPER_BOUND)
-        )
-        .when(
-            (~pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") > UPPER_BOUND)
-            & (pl.col("start_time") > UPPER_BOUND)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .when(
-            (~pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") > UPPER_BOUND)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(UPPER_BOUND)
-        )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") < UPPER_BOUND_SPECIAL_DAY)
-            & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") > UPPER_BOUND_SPECIAL_DAY)
-            & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .when(
-            (after_midnight)
-            & (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
-        )
-        .then(
-            pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .otherwise(NULL_DURATION),
+        total_duration=durations,
+        # Overtime for normal services: after the cut-off until midnight on
+        # normal days, until the special day cut-off on special days
+        overtime_for_normal_services=pl.when(pl.col("_special"))
+        .then(portion(0, UPPER_BOUND_SPECIAL_DAY_SECONDS))
+        .otherwise(portion(UPPER_BOUND_SECONDS, SECONDS_IN_A_DAY)),
         # Overtime for extended services (special days after cutoff and all after-midnight portions)
-        overtime_for_extended_services=pl.when(
-            # After midnight portion on normal days (goes to 200%)
-            (after_midnight) & (~pl.col("day").is_in(SPECIAL_DAYS))
-        )
-        .then(
-            (pl.col("date") + pl.duration(days=1)).dt.combine(pl.col("end_time"))
-            - (pl.col("date") + pl.duration(days=1)).dt.combine(pl.lit(0))
-        )
-        .when(
-            (after_midnight)
-            & (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("start_time") >= UPPER_BOUND_SPECIAL_DAY)
-        )
-        .then(duration_after_midnight)
-        .when(
-            (after_midnight)
-            & (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
-        )
-        .then(
-            (pl.col("date") + pl.duration(days=1)).dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-        )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") > UPPER_BOUND_SPECIAL_DAY)
-            & (pl.col("start_time") > UPPER_BOUND_SPECIAL_DAY)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(pl.col("start_time"))
-        )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS))
-            & (pl.col("end_time") > UPPER_BOUND_SPECIAL_DAY)
-            & (~after_midnight)
-        )
-        .then(
-            pl.col("date").dt.combine(pl.col("end_time"))
-            - pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-        )
-        .otherwise(NULL_DURATION),
+        overtime_for_extended_services=pl.when(pl.col("_special"))
+        .then(portion(UPPER_BOUND_SPECIAL_DAY_SECONDS))
+        .otherwise(portion(SECONDS_IN_A_DAY)),
     ).with_columns(
         # Calculate normal hour services as total minus both overtime categories
-        normal_hour_services=pl.when(after_midnight)
+        normal_hour_services=pl.when(pl.col("_after_mid"))
         .then(
-            pl.when(
-                ~pl.col("day").is_in(SPECIAL_DAYS)
-                & (pl.col("start_time") < UPPER_BOUND)
-            )
-            .then(
-                pl.col("date").dt.combine(UPPER_BOUND)
-                - pl.col("date").dt.combine(pl.col("start_time"))
-            )
-            .when(
-                pl.col("day").is_in(SPECIAL_DAYS)
-                & (pl.col("start_time") < UPPER_BOUND_SPECIAL_DAY)
-            )
-            .then(
-                pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-                - pl.col("date").dt.combine(pl.col("start_time"))
-            )
-            .otherwise(NULL_DURATION)
+            pl.when(pl.col("_special"))
+            .then(portion(0, UPPER_BOUND_SPECIAL_DAY_SECONDS))
+            .otherwise(portion(0, UPPER_BOUND_SECONDS))
         )
         .otherwise(
             pl.col("total_duration")
@@ -460,7 +211,7 @@ async def forklift_salt()-> pl.LazyFrame:
                 + pl.col("overtime_for_extended_services")
             )
         )
-    )
+    ).drop(SALT_HELPER_COLUMNS)
     )
 
     # Format all duration columns to HH:MM format
@@ -476,22 +227,25 @@ async def forklift_salt()-> pl.LazyFrame:
 
 
 add_day_name_col: pl.Expr = (
-    pl.when(pl.col("Date").is_in(ph_list))
+    pl.when(pl.col("Date").is_in(PUBLIC_HOLIDAYS))
     .then(pl.lit(DayName.PH.value))
-    .otherwise(pl.col("Date").dt.to_string(format="%a"))
+    .otherwise(weekday_name(pl.col("Date")))
 )
 
 
 async def bin_tipping() -> pl.LazyFrame:
     """Bin Tipping dataset"""
-    df = await load_gsheet_data(
-        sheet_id=SHORE_HANDLING_ID, sheet_name=BIN_TIPPING_SHEET
+    df, price = await asyncio.gather(
+        load_gsheet_data(sheet_id=SHORE_HANDLING_ID, sheet_name=BIN_TIPPING_SHEET),
+        price_list(),
     )
-    price = await price_list()
     bin_tipping_price = price.get("bin_tipping_price")
+    normal_rate = bin_tipping_price * OvertimePerc.normal_hour
+    overtime_150_rate = bin_tipping_price * OvertimePerc.overtime_150
+    overtime_200_rate = bin_tipping_price * OvertimePerc.overtime_200
     return (
-        df.with_columns(Date=pl.col("Date").str.to_date(format="%d/%m/%Y"))
-        .filter(pl.col("Tonnage Tipped").gt(0))
+        df.filter(pl.col("Tonnage Tipped").gt(0))
+        .with_columns(pl.col("Date").str.to_date(format="%d/%m/%Y"))
         .with_columns(
             day_name=add_day_name_col,
             Service=pl.lit("IPHS Bin Tipping"),
@@ -506,24 +260,20 @@ async def bin_tipping() -> pl.LazyFrame:
             pl.col("Tonnage Tipped").cast(pl.Float64),
             pl.col("Overtime"),
         )
+        .with_columns(
+            normal_tonnage=pl.col("Tonnage Tipped") - pl.col("Overtime"),
+        )
         .with_columns(
             price=bin_tipping_price,
             total_price=pl.when(pl.col("day_name").is_in(SPECIAL_DAYS))
             .then(
-                (
-                    bin_tipping_price
-                    * OvertimePerc.overtime_150
-                    * (pl.col("Tonnage Tipped") - pl.col("Overtime"))
-                )
-                + (bin_tipping_price * OvertimePerc.overtime_200 * pl.col("Overtime"))
+                (pl.col("normal_tonnage") * overtime_150_rate)
+                + (pl.col("Overtime") * overtime_200_rate)
             )
             .otherwise(
-                (
-                    bin_tipping_price
-                    * OvertimePerc.normal_hour
-                    * (pl.col("Tonnage Tipped") - pl.col("Overtime"))
-                )
-                + (bin_tipping_price * OvertimePerc.overtime_150 * pl.col("Overtime"))
+                (pl.col("normal_tonnage") * normal_rate)
+                + (pl.col("Overtime") * overtime_150_rate)
             ),
         )
+        .drop("normal_tonnage")
     )
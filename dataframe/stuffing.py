@@ -1,6 +1,7 @@
 """Stuffing Lazyframes"""
 
 from datetime import timedelta
+import asyncio
 import polars as pl
 from data_source.make_dataset import load_gsheet_data
 from data_source.sheet_ids import STUFFING_SHEET_ID, liner_pallet_sheet, plugin_sheet
@@ -17,76 +18,72 @@ from type_casting.validations import PLUGGED_STATUS
 
 
 # Price
-async def price_list() -> dict[str, float | pl.LazyFrame]:
-    """price dictionary"""
+# Prices rarely change, so they are fetched once per process
+_price_cache: dict[str, float | pl.LazyFrame] = {}
+_price_lock = asyncio.Lock()
 
-    price = await get_price()
 
-    liner_price = (
-        price.filter(pl.col("Service").eq("Plastic Liner Installation"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
+async def _load_price_list() -> dict[str, float | pl.LazyFrame]:
+    """Loads the prices from the price sheet"""
 
-    magnum_electricity = (
-        price.filter(pl.col("Service").eq("Electricity Price Magnum"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    monitoring_price = (
-        price.filter(pl.col("Service").eq("Monitoring"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    pallet_iot_price = (
-        price.filter(pl.col("Service").eq("Pallets(+ Wedges) Usage"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    pallet_price = (
-        price.filter(pl.col("Service").eq("Pallets"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    plugin_price = (
-        price.filter(pl.col("Service").eq("Plugin"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    s_freezer_electricity = (
-        price.filter(pl.col("Service").eq("Electricity Price S Freezer"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
-    standard_electricity = (
-        price.filter(pl.col("Service").eq("Electricity Price Standard"))
-        .select(pl.col("Price"))
-        .collect()
-        .to_series()[0]
-    )
+    price = await get_price()
+
+    # One collect for every service; the first row per service is the one used
+    prices = price.unique(subset="Service", keep="first", maintain_order=True).collect()
+    price_by_service = dict(zip(prices["Service"].to_list(), prices["Price"].to_list()))
 
     return {
-        "liner_price": liner_price,
-        "magnum_electricity": magnum_electricity,
-        "monitoring_price": monitoring_price,
-        "pallet_iot_price": pallet_iot_price,
-        "pallet_price": pallet_price,
-        "plugin_price": plugin_price,
-        "s_freezer_electricity": s_freezer_electricity,
-        "standard_electricity": standard_electricity,
+        "liner_price": price_by_service["Plastic Liner Installation"],
+        "magnum_electricity": price_by_service["Electricity Price Magnum"],
+        "monitoring_price": price_by_service["Monitoring"],
+        "pallet_iot_price": price_by_service["Pallets(+ Wedges) Usage"],
+        "pallet_price": price_by_service["Pallets"],
+        "plugin_price": price_by_service["Plugin"],
+        "s_freezer_electricity": price_by_service["Electricity Price S Freezer"],
+        "standard_electricity": price_by_service["Electricity Price Standard"],
     }
 
 
+async def price_list() -> dict[str, float | pl.LazyFrame]:
+    """price dictionary"""
+    async with _price_lock:
+        if not _price_cache:
+            _price_cache.update(await _load_price_list())
+    return _price_cache.copy()
+
+
+# Enum dtypes built from the customer lists, once per process
+_enum_cache: dict[str, pl.Enum] = {}
+
+
+async def customer_enums() -> dict[str, pl.Enum]:
+    """Customer and shipping line enums used by the stuffing datasets"""
+    if not _enum_cache:
+        customer_type = await get_customer_by_type()
+        shipping_line = customer_type.get("shipping_line")
+        _enum_cache.update(
+            {
+                "coa_customer": pl.Enum(
+                    customer_type.get("ship_owner_operator")
+                    + shipping_line
+                    + customer_type.get("bycatch")
+                    + customer_type.get("agent")
+                    + ["IOT EXPORT", "CCCS", "IPHS"]
+                ),
+                "shipping_line": pl.Enum(shipping_line),
+                "pallet_shipping_line": pl.Enum(shipping_line + ["SAPMER"]),
+            }
+        )
+    return _enum_cache
+
+
 # Yard Metrics
-transfer_direct: pl.Expr = pl.col("operation_type").str.contains("Direct")
-exchange_hands: pl.Expr = pl.col("operation_type").str.contains("Exchange")
+transfer_direct: pl.Expr = pl.col("operation_type").str.contains(
+    "Direct", literal=True
+)
+exchange_hands: pl.Expr = pl.col("operation_type").str.contains(
+    "Exchange", literal=True
+)
 
 
 on_plug_or_partially_stuffed: pl.Expr = pl.col("location").is_in(
@@ -97,9 +94,8 @@ partially_stuffed: pl.Expr = pl.col("location").is_in(["For Completion"])
 plugged_only: pl.Expr = pl.col("location") == "Plugin Only"
 
 # Durations
-duration: pl.Expr = (
-    (pl.col("date_out") - pl.col("date_plugged")).dt.total_hours() / 24
-).cast(pl.Int64)
+# Whole days between the two dates, straight from the duration
+duration: pl.Expr = (pl.col("date_out") - pl.col("date_plugged")).dt.total_days()
 
 
 async def load_pallet_dataset() -> pl.LazyFrame:
@@ -109,13 +105,12 @@ async def load_pallet_dataset() -> pl.LazyFrame:
     )
     containers = await containers_enum()
 
-    customers = await get_customer_by_type()
-    shipping_line = customers.get("shipping_line")
+    enums = await customer_enums()
 
     return df.select(
         pl.col("date").str.to_date(format="%d/%m/%Y"),
         pl.col("container_number").cast(dtype=containers),
-        pl.col("shipping_line").cast(dtype=pl.Enum(shipping_line + ["SAPMER"])),
+        pl.col("shipping_line").cast(dtype=enums.get("pallet_shipping_line")),
         pl.col("assigned_to").str.to_uppercase(),
         pl.col("remarks").cast(dtype=pl.Enum(PALLET_TYPE)),
     )
@@ -129,30 +124,22 @@ async def pallet() -> pl.LazyFrame:
     iot_price = price.get("pallet_iot_price")
     pallet_price = price.get("pallet_price")
     liner_price = price.get("liner_price")
+    # remarks is an Enum of PALLET_TYPE, so test membership instead of
+    # running a substring match per row, once per branch
+    with_pallet = pl.col("remarks").is_in(
+        [remark for remark in PALLET_TYPE if "Pallet" in remark]
+    )
+    with_liner = pl.col("remarks").is_in(
+        [remark for remark in PALLET_TYPE if "Liner" in remark]
+    )
     return df.with_columns(
-        pallet_price=pl.when(
-            (
-                pl.col("remarks")
-                .cast(pl.Utf8)
-                .str.contains(pl.lit("Pallet"), strict=True)
-            ).and_(pl.col("shipping_line").eq(pl.lit("IOT")))
-        )
+        pallet_price=pl.when(with_pallet & pl.col("shipping_line").eq(pl.lit("IOT")))
         .then(iot_price)
-        .when(
-            (
-                pl.col("remarks")
-                .cast(pl.Utf8)
-                .str.contains(pl.lit("Pallet"), strict=True)
-            )
-        )
+        .when(with_pallet)
         .then(pallet_price)
         .otherwise(FREE),
         liner_price=pl.when(
-            (
-                pl.col("remarks")
-                .cast(pl.Utf8)
-                .str.contains(pl.lit("Liner"), strict=True)
-            ).and_(pl.col("shipping_line").eq(pl.lit("CMA CGM")))
+            with_liner & pl.col("shipping_line").eq(pl.lit("CMA CGM"))
         )
         .then(liner_price)
         .otherwise(FREE),
@@ -164,12 +151,7 @@ async def coa() -> pl.LazyFrame:
     df = await load_gsheet_data(STUFFING_SHEET_ID, plugin_sheet)
     # customers = await enum_customer()
 
-    customer_type = await get_customer_by_type()
-    shipper = customer_type.get("ship_owner_operator")
-    by_catch_company = customer_type.get("bycatch")
-    agent = customer_type.get("agent")
-
-    shipping_line = customer_type.get("shipping_line")
+    enums = await customer_enums()
 
     containers = await containers_enum()
 
@@ -183,20 +165,12 @@ async def coa() -> pl.LazyFrame:
     return (
         df.select(
             pl.col("vessel_client").str.to_uppercase().cast(dtype=pl.Utf8),
-            pl.col("customer").cast(
-                dtype=pl.Enum(
-                    shipper
-                    + shipping_line
-                    + by_catch_company
-                    + agent
-                    + ["IOT EXPORT", "CCCS","IPHS"]
-                )
-            ),
+            pl.col("customer").cast(dtype=enums.get("coa_customer")),
             pl.col("date_plugged").str.to_date(format="%d/%m/%Y"),
             pl.col("time_plugged").str.to_time(format="%H:%M:%S", strict=False),
             pl.col("container_number").cast(dtype=containers),
             pl.col("operation_type"),
-            pl.col("shipping_line").cast(dtype=pl.Enum(shipping_line)),
+            pl.col("shipping_line").cast(dtype=enums.get("shipping_line")),
             pl.col("plugged_status").cast(dtype=pl.Enum(PLUGGED_STATUS)),
             pl.col("tonnage"),
             pl.col("set_point"),
@@ -219,22 +193,21 @@ async def coa() -> pl.LazyFrame:
             .otherwise(
                 monitoring_price,
             ),
-        )
-        .with_columns(
             electricity_unit_price=pl.when(plugged_only)
             .then(pl.lit(0))
             .when(pl.col("set_point").eq(-60))
             .then(s_freezer_electricity)
             .when(pl.col("set_point").eq(-35))
             .then(magnum_electricity)
-            .otherwise(standard_electricity)
+            .otherwise(standard_electricity),
         )
+        # Columns built above are only visible from the next with_columns
         .with_columns(
-            total_electricity=pl.col("electricity_unit_price") * pl.col("days_on_plug")
+            total_electricity=pl.col("electricity_unit_price") * pl.col("days_on_plug"),
         )
         .with_columns(
             total=pl.col("plugin_price")
             + pl.col("monitoring_price")
-            + pl.col("total_electricity")
+            + pl.col("total_electricity"),
         )
     )
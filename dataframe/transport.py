@@ -1,5 +1,6 @@
 """Transport Lazyframe"""
 
+import asyncio
 from datetime import date
 import polars as pl
 import polars.selectors as cs
@@ -17,26 +18,30 @@ from type_casting.dates import (
     SPECIAL_DAYS,
     UPPER_BOUND,
     UPPER_BOUND_SPECIAL_DAY,
-    DayName,
+    PUBLIC_HOLIDAYS,
 )
 from type_casting.containers import containers_enum
 from type_casting.validations import STATUS_TYPE, OvertimePerc, Status
 
-ph_list: list[date] = DayName.public_holiday_series()
+ph_list: list[date] = PUBLIC_HOLIDAYS
 
 # Need to make this as a LazyFrame and do a joinasof incase there is a change in price
 
+# Prices rarely change, so they are fetched once per process
+_price_cache: dict[str, float | pl.LazyFrame] = {}
+_price_lock = asyncio.Lock()
 
-async def price_list() -> dict[str, float | pl.LazyFrame]:
-    """price dictionary"""
+
+async def _load_price_list() -> dict[str, float | pl.LazyFrame]:
+    """Loads the prices from the price sheet"""
 
     price = await get_price(["Shifting", "Haulage FEU", "Haulage TEU"])
 
     shifting_price = (
         price.filter(pl.col("Service").eq("Shifting"))
-        .select(pl.col("Price"))
+        .select(pl.col("Price").first())
         .collect()
-        .to_series()[0]
+        .item()
     )
     transfer_price = price.filter(
         pl.col("Service").is_in(["Haulage FEU", "Haulage TEU"])
@@ -48,97 +53,118 @@ async def price_list() -> dict[str, float | pl.LazyFrame]:
     }
 
 
+async def price_list() -> dict[str, float | pl.LazyFrame]:
+    """price dictionary"""
+    async with _price_lock:
+        if not _price_cache:
+            _price_cache.update(await _load_price_list())
+    return _price_cache.copy()
+
+
+# Shore crane operations
+operation_type: pl.Enum = pl.Enum(
+    [
+        "Stuffing",
+        "Loading Provision",
+        "OSS Stuffing",
+        "CCCS Container Stuffing",
+        "Loading to CCCS",
+        "Cross Stuffing",
+        "By Catch",
+    ]
+)
+
+
 async def shore_crane() -> pl.LazyFrame:
     """Load shore crane rental record"""
 
-    operation_type: pl.Enum = pl.Enum(
-        [
-            "Stuffing",
-            "Loading Provision",
-            "OSS Stuffing",
-            "CCCS Container Stuffing",
-            "Loading to CCCS",
-            "Cross Stuffing",
-            "By Catch",
-        ]
-    )
-
     df = await load_gsheet_data(TRANSPORT_SHEET_ID, shore_crane_sheet)
     return df.select(
         pl.col("day").cast(dtype=pl.Enum(DAY_NAMES)),
         cs.contains("date").str.to_date(format="%d/%m/%Y"),
         pl.col("start_time").str.to_time(format="%H:%M:%S"),
         pl.col("end_time").str.to_time(format="%H:%M:%S"),
-        pl.col("hours").str.to_time(format="%H:%M:%S").dt.hour(),
-        pl.col("overtime_hours").str.to_time(format="%H:%M").dt.hour(),
+        # Only the whole hours are kept, so read them without parsing a time
+        pl.col("hours").str.split(":").list.first().cast(pl.Int8),
+        pl.col("overtime_hours").str.split(":").list.first().cast(pl.Int8),
         pl.col("customer").cast(pl.Utf8),
         pl.col("operation_type").cast(dtype=operation_type),
         pl.col("remarks"),
         pl.col("invoiced_to"),
         pl.col("price").cast(pl.Float64),
-        pl.col("total_price").str.replace_many(["$", ","], "").cast(pl.Float64),
+        pl.col("total_price")
+        .str.replace_all("$", "", literal=True)
+        .str.replace_all(",", "", literal=True)
+        .cast(pl.Float64),
     )
 
 
+location: list[str] = [
+    "LML",
+    "HD YARD",
+    "FISHING PORT",
+    "CCCS",
+    "IPHS",
+    "IOT",
+    "JHL",
+    "Fishing Port",
+]
+
+# Enum dtypes of the transfer sheet columns, applied in a single cast
+TRANSFER_DTYPES: dict[str, pl.Enum] = {
+    "line": pl.Enum(
+        [
+            "CCCS",
+            "UAFL",
+            "DONGWON",
+            "SAPMER",
+            "CMA CGM",
+            "IPHS",
+            "MAERSK",
+            "IOT",
+            "PEVASA",
+        ]
+    ),
+    "movement_type": pl.Enum(["Collection", "Shifting", "Delivery"]),
+    "driver": pl.Enum(["NA", "IPHS", "THIRD PARTY", "IPHS (Third Party)"]),
+    "origin": pl.Enum(location),
+    "destination": pl.Enum(location),
+    "status": pl.Enum(["Full", "Empty"]),
+    "type": pl.Enum(["Reefer", "Dry"]),
+    "size": pl.Enum(["20'", "40'"]),
+}
+
+
 async def transfer() -> pl.LazyFrame:
     """Transfer (Haulage) dataset"""
 
-    df = await load_gsheet_data(TRANSPORT_SHEET_ID, transfer_sheet)
-
-    location: list[str] = [
-        "LML",
-        "HD YARD",
-        "FISHING PORT",
-        "CCCS",
-        "IPHS",
-        "IOT",
-        "JHL",
-        "Fishing Port",
-    ]
+    df, price, containers = await asyncio.gather(
+        load_gsheet_data(TRANSPORT_SHEET_ID, transfer_sheet),
+        price_list(),
+        containers_enum(),
+    )
 
-    price = await price_list()
     shifting_price_float: float = price.get("shifting")
+    # Fold the rate multipliers into the price once, outside the row maths
+    shifting_150_rate = shifting_price_float * OvertimePerc.overtime_150
+    shifting_200_rate = shifting_price_float * OvertimePerc.overtime_200
 
-    transfer_price = price.get("transfer").with_columns(
-        Date=pl.col("Date").str.to_date(format="%d/%m/%Y")
+    # join_asof needs both sides in date order
+    transfer_price = (
+        price.get("transfer")
+        .with_columns(Date=pl.col("Date").str.to_date(format="%d/%m/%Y"))
+        .sort("Date")
     )
 
-    containers = await containers_enum()
-
     return (
         df.with_columns(
             pl.col("date").str.to_date(format="%d/%m/%Y"),
-            pl.col("container_number").cast(dtype=containers),
-            pl.col("line").cast(
-                dtype=pl.Enum(
-                    [
-                        "CCCS",
-                        "UAFL",
-                        "DONGWON",
-                        "SAPMER",
-                        "CMA CGM",
-                        "IPHS",
-                        "MAERSK",
-                        "IOT",
-                        "PEVASA",
-                    ]
-                )
-            ),
-            pl.col("movement_type").cast(
-                dtype=pl.Enum(["Collection", "Shifting", "Delivery"])
-            ),
-            pl.col("driver").cast(
-                dtype=pl.Enum(["NA", "IPHS", "THIRD PARTY", "IPHS (Third Party)"])
-            ),
-            pl.col("origin").cast(dtype=pl.Enum(location)),
             pl.col("time_out").str.to_time(format="%H:%M"),
-            pl.col("destination").cast(dtype=pl.Enum(location)),
             pl.col("time_in").str.to_time(format="%H:%M"),
-            pl.col("status").cast(dtype=pl.Enum(["Full", "Empty"])),
-            pl.col("type").cast(dtype=pl.Enum(["Reefer", "Dry"])),
-            pl.col("size").cast(dtype=pl.Enum(["20'", "40'"])),
         )
-        .select(pl.all().exclude("invoice_to"))
+        .cast({**TRANSFER_DTYPES, "container_number": containers})
+        # Derived from the parsed columns, so this cannot join the block above;
+        # invoice_to is left out by the final select
         .with_columns(
             day_name=pl.when(pl.col("date").is_in(ph_list))
             .then(pl.lit("PH"))
@@ -155,6 +181,13 @@ async def transfer() -> pl.LazyFrame:
             .then(pl.col("time_out"))
             .otherwise(pl.time()),
         )
+        # Evaluate the overtime tests once, for both prices below
+        .with_columns(
+            _special=pl.col("day_name").is_in(SPECIAL_DAYS),
+            _after_special_cutoff=pl.col("time") > UPPER_BOUND_SPECIAL_DAY,
+            _after_cutoff=pl.col("time") > UPPER_BOUND,
+        )
+        .sort("date", maintain_order=True)
         .join_asof(
             transfer_price,
             by="Service",
@@ -171,30 +204,18 @@ async def transfer() -> pl.LazyFrame:
                 )
             )
             .then(FREE)
-            .when(
-                (pl.col("day_name").is_in(SPECIAL_DAYS))
-                & (pl.col("time") > UPPER_BOUND_SPECIAL_DAY)
-            )
-            .then(shifting_price_float * OvertimePerc.overtime_200)
-            .when(
-                (pl.col("day_name").is_in(SPECIAL_DAYS))
-                | (pl.col("time") > UPPER_BOUND)
-            )
-            .then(shifting_price_float * OvertimePerc.overtime_150)
+            .when(pl.col("_special") & pl.col("_after_special_cutoff"))
+            .then(shifting_200_rate)
+            .when(pl.col("_special") | pl.col("_after_cutoff"))
+            .then(shifting_150_rate)
             .otherwise(shifting_price_float),
             haulage_price=pl.when(
                 (~pl.col("driver").cast(pl.Utf8).str.contains("IPHS"))
             )
             .then(pl.lit(0))
-            .when(
-                (pl.col("day_name").is_in(SPECIAL_DAYS))
-                & (pl.col("time") > UPPER_BOUND_SPECIAL_DAY)
-            )
+            .when(pl.col("_special") & pl.col("_after_special_cutoff"))
             .then(pl.col("Price") * OvertimePerc.overtime_200)
-            .when(
-                (pl.col("day_name").is_in(SPECIAL_DAYS))
-                | (pl.col("time") > UPPER_BOUND)
-            )
+            .when(pl.col("_special") | pl.col("_after_cutoff"))
             .then(pl.col("Price") * OvertimePerc.overtime_150)
             .otherwise(pl.col("Price")),
         )
@@ -221,6 +242,22 @@ async def transfer() -> pl.LazyFrame:
     )
 
 
+# Scow transfer containers, customers and yards
+scow_containers: pl.Enum = pl.Enum(["STDU6536343", "STDU6536338"])
+scow_customers: pl.Enum = pl.Enum(
+    [
+        "IOT",
+        "AQUARIUS",
+        "ECHEBASTAR",
+        "SAPMER",
+        "ISLAND CATCH",
+        "INPESCA S.A",
+    ]
+)
+scow_locations: pl.Enum = pl.Enum(["CCCS", "IOT", "FISHING PORT"])
+scow_movements: pl.Enum = pl.Enum(["Collection", "Delivery"])
+
+
 async def scow_transfer() -> pl.LazyFrame:
     """Scow Transfer/ Bin Dispatch dataset"""
 
@@ -228,24 +265,13 @@ async def scow_transfer() -> pl.LazyFrame:
 
     return df.select(
         pl.col("date").str.to_date(format="%d/%m/%Y"),
-        pl.col("container_number").cast(dtype=pl.Enum(["STDU6536343", "STDU6536338"])),
-        pl.col("customer").cast(
-            pl.Enum(
-                [
-                    "IOT",
-                    "AQUARIUS",
-                    "ECHEBASTAR",
-                    "SAPMER",
-                    "ISLAND CATCH",
-                    "INPESCA S.A",
-                ]
-            )
-        ),
-        pl.col("movement_type").cast(pl.Enum(["Collection", "Delivery"])),
+        pl.col("container_number").cast(dtype=scow_containers),
+        pl.col("customer").cast(scow_customers),
+        pl.col("movement_type").cast(scow_movements),
         pl.col("driver"),
-        pl.col("from").cast(pl.Enum(["CCCS", "IOT", "FISHING PORT"])),
+        pl.col("from").cast(scow_locations),
         pl.col("time_out").str.to_time(format="%H:%M:%S"),
-        pl.col("destination").cast(pl.Enum(["CCCS", "IOT", "FISHING PORT"])),
+        pl.col("destination").cast(scow_locations),
         pl.col("time_in").str.to_time(format="%H:%M:%S"),
         pl.col("status").cast(dtype=pl.Enum(STATUS_TYPE)),
         pl.col("remarks"),
@@ -253,6 +279,24 @@ async def scow_transfer() -> pl.LazyFrame:
     ).with_columns(duration=pl.col("time_in") - pl.col("time_out"))
 
 
+# Forklift times as minutes since midnight; an end before the start is
+# taken to run past midnight, so every service is one interval
+MINUTES_IN_A_DAY: int = 1_440
+UPPER_BOUND_MINUTES: int = UPPER_BOUND.hour * 60
+UPPER_BOUND_SPECIAL_DAY_MINUTES: int = UPPER_BOUND_SPECIAL_DAY.hour * 60
+
+start_minutes = pl.col("start_time").cast(pl.Int64) // 60_000_000_000
+end_minutes = pl.col("end_time").cast(pl.Int64) // 60_000_000_000 + pl.when(
+    pl.col("end_time") < pl.col("start_time")
+).then(MINUTES_IN_A_DAY).otherwise(0)
+
+
+def minutes_between(lower: int, upper: int | None = None) -> pl.Expr:
+    """Minutes of the service falling between lower and upper"""
+    end = pl.col("_end") if upper is None else pl.min_horizontal("_end", upper)
+    return (end - pl.max_horizontal(pl.col("_start"), lower)).clip(lower_bound=0)
+
+
 async def forklift() -> pl.LazyFrame:
     """Forklift dataset"""
     df = await load_gsheet_data(TRANSPORT_SHEET_ID, forklift_sheet)
@@ -272,78 +316,25 @@ async def forklift() -> pl.LazyFrame:
             pl.col("service_type"),
         )
         .with_columns(
-            overtime_150=pl.when(
-                (pl.col("day").is_in(SPECIAL_DAYS).not_())
-                .and_(pl.col("end_time").gt(UPPER_BOUND))
-                .and_(pl.col("start_time").gt(UPPER_BOUND))
-            )
-        )
-        .then(
-            (
-                pl.col("date").dt.combine(pl.col("end_time"))
-                - pl.col("date").dt.combine(pl.col("start_time"))
-            ).dt.total_minutes()
+            _special=pl.col("day").is_in(SPECIAL_DAYS),
+            _start=start_minutes,
+            _end=end_minutes,
         )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS).not_())
-            .and_((pl.col("end_time").lt(UPPER_BOUND)))
-            .then(
-                (
-                    pl.col("date").dt.combine(pl.col("end_time"))
-                    - pl.col("date").dt.combine(UPPER_BOUND)
-                ).dt.total_minutes()
-            )
-            .when(
-                (pl.col("day").is_in(SPECIAL_DAYS))
-                .and_(pl.col("end_time").gt(UPPER_BOUND_SPECIAL_DAY))
-                .and_(pl.col("start_time").gt(UPPER_BOUND_SPECIAL_DAY))
-            )
-            .then(
-                (
-                    pl.col("date").dt.combine(pl.col("end_time"))
-                    - pl.col("date").dt.combine(pl.col("start_time"))
-                ).dt.total_minutes()
-            )
-            .when(
-                (pl.col("day").is_in(SPECIAL_DAYS))
-                .and_(pl.col("end_time").lt(UPPER_BOUND_SPECIAL_DAY))
-                .and_(pl.col("start_time").gt(UPPER_BOUND_SPECIAL_DAY))
-            )
-            .then(
-                (
-                    pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-                    - pl.col("date").dt.combine(pl.col("start_time"))
-                ).dt.total_minutes()
-            )
-            .otherwise(FREE),
-            overtime_200=pl.when(
-                (pl.col("day").is_in(SPECIAL_DAYS))
-                .and_(pl.col("end_time").lt(UPPER_BOUND_SPECIAL_DAY))
-                .and_(pl.col("start_time").lt(UPPER_BOUND_SPECIAL_DAY))
-            ),
-        )
-        .then(
-            (
-                pl.col("date").dt.combine(pl.col("end_time"))
-                - pl.col("date").dt.combine(pl.col("start_time"))
-            ).dt.total_minutes()
-        )
-        .when(
-            (pl.col("day").is_in(SPECIAL_DAYS))
-            .and_(pl.col("end_time").lt(UPPER_BOUND_SPECIAL_DAY))
-            .then(
-                (
-                    pl.col("date").dt.combine(pl.col("end_time"))
-                    - pl.col("date").dt.combine(UPPER_BOUND_SPECIAL_DAY)
-                ).dt.total_minutes()
-            )
-            .otherwise(FREE),
+        .with_columns(
+            # 150% after the cut-off on normal days, until the special day
+            # cut-off on special days
+            overtime_150=pl.when(pl.col("_special"))
+            .then(minutes_between(0, UPPER_BOUND_SPECIAL_DAY_MINUTES))
+            .otherwise(minutes_between(UPPER_BOUND_MINUTES)),
+            # 200% after the special day cut-off
+            overtime_200=pl.when(pl.col("_special"))
+            .then(minutes_between(UPPER_BOUND_SPECIAL_DAY_MINUTES))
+            .otherwise(0),
         )
         .with_columns(
-            normal_hours=(
-                pl.col("date").dt.combine(pl.col("end_time"))
-                - pl.col("date").dt.combine(pl.col("start_time"))
-            ).dt.total_minutes()
+            normal_hours=pl.col("_end")
+            - pl.col("_start")
             - (pl.col("overtime_150") + pl.col("overtime_200"))
         )
+        .drop(["_special", "_start", "_end"])
     )
@@ -1,5 +1,6 @@
 """Cleaning datasets"""
 
+from functools import lru_cache
 from pathlib import Path
 import polars as pl
 
@@ -12,56 +13,51 @@ logistics_sheet: tuple[Path, str] = (
 
 invoice_sheet: Path = Path(r"P:\Verification & Invoicing\Validation Report\csv\washing.csv")
 
-logistics_df: pl.DataFrame = (
-    pl.read_excel(
-        logistics_sheet[0],
-        sheet_name=logistics_sheet[1],
-    )
-    .filter(pl.col("Invoiced").ne(pl.lit("Invalid")))
-    .with_columns(
-        pl.col("Client").str.to_uppercase().alias("Client"),
+
+@lru_cache(maxsize=1)
+def _difference_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Rows missing from the other side, read once on first use"""
+    logistics_df: pl.LazyFrame = (
+        pl.read_excel(
+            logistics_sheet[0],
+            sheet_name=logistics_sheet[1],
+        ).lazy()
+        .filter(pl.col("Invoiced").ne(pl.lit("Invalid")))
+        .with_columns(
+            pl.col("Client").str.to_uppercase().alias("Client"),
+        )
+        .select(pl.all().exclude(["Invoiced", "Check", "Verify"]))
     )
-    .select(pl.all().exclude(["Invoiced", "Check", "Verify"]))
-)
 
-invoice_df: pl.DataFrame = (
-    pl.read_csv(invoice_sheet, try_parse_dates=True)
-    .filter(pl.col("invoice_to").ne(pl.lit("INVALID")))
-    .select(pl.all().exclude(["price"]))
-)
+    invoice_df: pl.LazyFrame = (
+        pl.scan_csv(invoice_sheet, try_parse_dates=True)
+        .filter(pl.col("invoice_to").ne(pl.lit("INVALID")))
+        .select(pl.all().exclude(["price"]))
+    )
 
-cleaning_log_df = (
-    logistics_df.join(
+    cleaning_log_lf: pl.LazyFrame = logistics_df.join(
         other=invoice_df,
         left_on=["Cleaning Date", "Container Ref. No."],
         right_on=["date", "container_number"],
-        how="full",
-    )
-    .filter(pl.col("date").is_null())
-    .select(
-        pl.all().exclude(
-            ["Verify", "date", "container_number", "invoice_to", "service_remarks"]
-        )
+        how="anti",
     )
-)
 
-cleaning_inv_df = (
-    invoice_df.join(
+    cleaning_inv_lf: pl.LazyFrame = invoice_df.join(
         other=logistics_df,
         right_on=["Cleaning Date", "Container Ref. No."],
         left_on=["date", "container_number"],
-        how="full",
-    )
-    .filter(pl.col("Cleaning Date").is_null())
-    .select(
-        pl.all().exclude(
-            [
-                "Cleaning Date",
-                "Container Ref. No.",
-                "Client",
-                "Visual Inspection/Remarks",
-            ]
-        )
-    )
-    .sort(by=["date"])
-)
+        how="anti",
+    ).sort(by=["date"])
+
+    # Both sides share the logistics and invoice scans, so collect them together
+    return tuple(pl.collect_all([cleaning_log_lf, cleaning_inv_lf]))
+
+
+def cleaning_log_df() -> pl.DataFrame:
+    """Cleaning logistics records with no matching invoice line"""
+    return _difference_frames()[0]
+
+
+def cleaning_inv_df() -> pl.DataFrame:
+    """Cleaning invoice lines with no matching logistics record"""
+    return _difference_frames()[1]
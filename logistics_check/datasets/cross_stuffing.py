@@ -1,5 +1,6 @@
 """Cross Stuffing datasets"""
 
+from functools import lru_cache
 from pathlib import Path
 import polars as pl
 
@@ -19,47 +20,44 @@ invoice_sheet: Path = (
     r"""P:\Verification & Invoicing\Validation Report\csv\cross_stuffing.csv"""
 )
 
-logistics_df: pl.DataFrame = pl.read_excel(
-    logistics_sheet[0],
-    sheet_name=logistics_sheet[1],
-)
 
-invoice_df: pl.DataFrame = (
-    pl.read_csv(invoice_sheet, try_parse_dates=True)
-    .filter(pl.col("invoiced").ne(pl.lit("INVALID")))
-    .select(pl.all().exclude(["Price", "total_price"]))
-)
+@lru_cache(maxsize=1)
+def _difference_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Rows missing from the other side, read once on first use"""
+    logistics_df: pl.LazyFrame = pl.read_excel(
+        logistics_sheet[0],
+        sheet_name=logistics_sheet[1],
+    ).lazy()
+
+    invoice_df: pl.LazyFrame = (
+        pl.scan_csv(invoice_sheet, try_parse_dates=True)
+        .filter(pl.col("invoiced").ne(pl.lit("INVALID")))
+        .select(pl.all().exclude(["Price", "total_price"]))
+    )
 
-cross_stuffing_log_df = (
-    logistics_df.join(
+    cross_stuffing_log_lf: pl.LazyFrame = logistics_df.join(
         other=invoice_df,
         left_on=["Date", "From Container Ref . No."],
         right_on=["date", "origin"],
-        how="full",
-    ).filter(pl.col("date").is_null())
-    # .select(
-    #     pl.all().exclude(
-    #         ["Verify", "date", "container_number", "invoice_to", "service_remarks"]
-    #     )
-    # )
-)
+        how="anti",
+    )
 
-cross_stuffing_inv_df = (
-    invoice_df.join(
+    cross_stuffing_inv_lf: pl.LazyFrame = invoice_df.join(
         other=logistics_df,
         right_on=["Date", "From Container Ref . No."],
         left_on=["date", "origin"],
-        how="full",
-    ).filter(pl.col("Date").is_null())
-    # .select(
-    #     pl.all().exclude(
-    #         [
-    #             "Cleaning Date",
-    #             "Container Ref. No.",
-    #             "Client",
-    #             "Visual Inspection/Remarks",
-    #         ]
-    #     )
-    # )
-    # .sort(by=["date"])
-)
+        how="anti",
+    )
+
+    # Both sides share the logistics and invoice scans, so collect them together
+    return tuple(pl.collect_all([cross_stuffing_log_lf, cross_stuffing_inv_lf]))
+
+
+def cross_stuffing_log_df() -> pl.DataFrame:
+    """Cross stuffing logistics records with no matching invoice line"""
+    return _difference_frames()[0]
+
+
+def cross_stuffing_inv_df() -> pl.DataFrame:
+    """Cross stuffing invoice lines with no matching logistics record"""
+    return _difference_frames()[1]
@@ -1,5 +1,6 @@
 """PTI datasets"""
 
+from functools import lru_cache
 from pathlib import Path
 import polars as pl
 
@@ -12,77 +13,54 @@ logistics_sheet: tuple[Path, str] = (
 
 invoice_sheet: Path = r"""P:\Verification & Invoicing\Validation Report\csv\pti.csv"""
 
-logistics_df: pl.DataFrame = (
-    pl.read_excel(
-        logistics_sheet[0],
-        sheet_name=logistics_sheet[1],
-        engine="openpyxl"
-    )
-    # .filter(pl.col("Invoiced").ne(pl.lit("Invalid")))
-    .with_columns(
-        pl.col("Date Plug").dt.date(),
-        pl.col("Line/Client").str.to_uppercase().alias("Client"),
+
+@lru_cache(maxsize=1)
+def _difference_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Rows missing from the other side, read once on first use"""
+    logistics_df: pl.LazyFrame = (
+        pl.read_excel(
+            logistics_sheet[0],
+            sheet_name=logistics_sheet[1],
+            engine="calamine",
+            schema_overrides={"Date Plug": pl.Date},
+        ).lazy()
+        # .filter(pl.col("Invoiced").ne(pl.lit("Invalid")))
+        .with_columns(
+            pl.col("Line/Client").str.to_uppercase().alias("Client"),
+        )
+        .select(pl.all().exclude(["Invoiced", "#", "Verify"]))
     )
-    .select(pl.all().exclude(["Invoiced", "#", "Verify"]))
-)
 
-invoice_df: pl.DataFrame = (
-    pl.read_csv(invoice_sheet, try_parse_dates=True)
-    .filter(pl.col("invoice_to").ne(pl.lit("INVALID")))
-    .with_columns(pl.col("datetime_start").dt.date().alias("date"))
-    .select(pl.all().exclude(["price"]))
-)
+    invoice_df: pl.LazyFrame = (
+        pl.scan_csv(invoice_sheet, try_parse_dates=True)
+        .filter(pl.col("invoice_to").ne(pl.lit("INVALID")))
+        .with_columns(pl.col("datetime_start").dt.date().alias("date"))
+        .select(pl.all().exclude(["price"]))
+    )
 
-pti_log_df = (
-    logistics_df.join(
+    pti_log_lf: pl.LazyFrame = logistics_df.join(
         other=invoice_df,
         left_on=["Date Plug", "Container Ref. No."],
         right_on=["date", "container_number"],
-        how="full",
+        how="anti",
     )
-    .filter(pl.col("date").is_null())
-    .select(
-        pl.all().exclude(
-            [
-                "Verify",
-                "date",
-                "container_number",
-                "invoice_to",
-                "date",
-                "service_remarks",
-                "hours",
-                "plugin_price",
-                "electricity_price",
-                "no_shifting",
-                "generator",
-                "shifting_price",
-                "total_price",
-
-            ]
-        )
-    )
-)
 
-pti_inv_df = (
-    invoice_df.join(
+    pti_inv_lf: pl.LazyFrame = invoice_df.join(
         other=logistics_df,
         right_on=["Date Plug", "Container Ref. No."],
         left_on=["date", "container_number"],
-        how="full",
-    )
-    .filter(pl.col("Date Plug").is_null())
-    .select(
-        pl.all().exclude(
-            [
-                "Date Plug",
-                "Container Ref. No.",
-                "Unit Manufacturer",
-                "Sticker",
-                "Invoiced",
-                "Hours",
-                "Generator"
-            ]
-        )
-    )
-    .sort(by=["date"])
-)
+        how="anti",
+    ).sort(by=["date"])
+
+    # Both sides share the logistics and invoice scans, so collect them together
+    return tuple(pl.collect_all([pti_log_lf, pti_inv_lf]))
+
+
+def pti_log_df() -> pl.DataFrame:
+    """PTI logistics records with no matching invoice line"""
+    return _difference_frames()[0]
+
+
+def pti_inv_df() -> pl.DataFrame:
+    """PTI invoice lines with no matching logistics record"""
+    return _difference_frames()[1]
@@ -1,5 +1,6 @@
 """Shifting datasets"""
 
+from functools import lru_cache
 from pathlib import Path
 import polars as pl
 
@@ -14,56 +15,50 @@ invoice_sheet: Path = (
     r"""P:\Verification & Invoicing\Validation Report\csv\shifting.csv"""
 )
 
-logistics_df: pl.DataFrame = (
-    pl.read_excel(
-        logistics_sheet[0],
-        sheet_name=logistics_sheet[1],
-    )
-    .filter(pl.col("Invoiced").ne(pl.lit("INVALID")))
-    .with_columns(
-        pl.col("Client").str.to_uppercase().alias("Client"),
+
+@lru_cache(maxsize=1)
+def _difference_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Rows missing from the other side, read once on first use"""
+    logistics_df: pl.LazyFrame = (
+        pl.read_excel(
+            logistics_sheet[0],
+            sheet_name=logistics_sheet[1],
+            engine="calamine",
+        ).lazy()
+        .filter(pl.col("Invoiced").ne(pl.lit("INVALID")))
+        .with_columns(
+            pl.col("Client").str.to_uppercase().alias("Client"),
+        )
+        .select(pl.all().exclude(["Invoiced"]))
     )
-    .select(pl.all().exclude(["Invoiced"]))
-)
 
-invoice_df: pl.DataFrame = pl.read_csv(invoice_sheet, try_parse_dates=True).select(
-    pl.all().exclude(["price"])
-)
+    invoice_df: pl.LazyFrame = pl.scan_csv(invoice_sheet, try_parse_dates=True).select(
+        pl.all().exclude(["price"])
+    )
 
-shifting_log_df = (
-    logistics_df.join(
+    shifting_log_lf: pl.LazyFrame = logistics_df.join(
         other=invoice_df,
         left_on=["Date Shifted", "Container Ref. No."],
         right_on=["date", "container_number"],
-        how="full",
-    )
-    .filter(pl.col("date").is_null())
-    .select(
-        pl.all().exclude(
-            [
-                "Verify",
-                "day_name",
-                "date",
-                "container_number",
-                "invoice_to",
-                "service_remarks",
-            ]
-        )
-    )
-)
+        how="anti",
+    ).select(pl.all().exclude(["Verify"]))
 
-shifting_inv_df = (
-    invoice_df.join(
+    shifting_inv_lf: pl.LazyFrame = invoice_df.join(
         other=logistics_df,
         right_on=["Date Shifted", "Container Ref. No."],
         left_on=["date", "container_number"],
-        how="full",
-    )
-    .filter(pl.col("Date Shifted").is_null())
-    .select(
-        pl.all().exclude(
-            ["Date Shifted", "Container Ref. No.", "Verify", "Client", "Remarks"]
-        )
-    )
-    .sort(by=["date"])
-)
+        how="anti",
+    ).sort(by=["date"])
+
+    # Both sides share the logistics and invoice scans, so collect them together
+    return tuple(pl.collect_all([shifting_log_lf, shifting_inv_lf]))
+
+
+def shifting_log_df() -> pl.DataFrame:
+    """Shifting logistics records with no matching invoice line"""
+    return _difference_frames()[0]
+
+
+def shifting_inv_df() -> pl.DataFrame:
+    """Shifting invoice lines with no matching logistics record"""
+    return _difference_frames()[1]
@@ -1,5 +1,6 @@
 """Transfer datasets"""
 
+from functools import lru_cache
 from pathlib import Path
 import polars as pl
 
@@ -14,104 +15,76 @@ invoice_sheet: Path = (
     r"""P:\Verification & Invoicing\Validation Report\csv\transfer.csv"""
 )
 
-logistics_df: pl.DataFrame = (
-    pl.read_excel(
-        logistics_sheet[0],
-        sheet_name=logistics_sheet[1],
-    ).filter(pl.col("Remarks").ne(pl.lit("INVALID")))
-    # .with_columns(
-    #     pl.col("Client").str.to_uppercase().alias("Client"),
-    # )
-    .select(
-        pl.all().exclude(
-            [
-                "Check",
-                "day_name",
-                "date",
-                "container_number",
-                "line",
-                "movement_type",
-                "driver",
-                "origin",
-                "time_out",
-                "destination",
-                "time_in",
-                "status",
-                "type",
-                "size",
-                "remarks",
-            ]
+
+@lru_cache(maxsize=1)
+def _difference_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Rows missing from the other side, read once on first use"""
+    logistics_df: pl.LazyFrame = (
+        pl.read_excel(
+            logistics_sheet[0],
+            sheet_name=logistics_sheet[1],
+            engine="calamine",
+        ).lazy().filter(pl.col("Remarks").ne(pl.lit("INVALID")))
+        # .with_columns(
+        #     pl.col("Client").str.to_uppercase().alias("Client"),
+        # )
+        .select(
+            pl.all().exclude(
+                [
+                    "Check",
+                    "day_name",
+                    "date",
+                    "container_number",
+                    "line",
+                    "movement_type",
+                    "driver",
+                    "origin",
+                    "time_out",
+                    "destination",
+                    "time_in",
+                    "status",
+                    "type",
+                    "size",
+                    "remarks",
+                ]
+            )
         )
     )
-)
 
-invoice_df: pl.DataFrame = (
-    pl.read_csv(invoice_sheet, try_parse_dates=True)
-    .filter(pl.col("movement_type").ne("Shifting"))
-    .select(pl.all().exclude(["shifting_price", "haulage_price"]))
-)
+    invoice_df: pl.LazyFrame = (
+        pl.scan_csv(invoice_sheet, try_parse_dates=True)
+        .filter(pl.col("movement_type").ne("Shifting"))
+        .select(pl.all().exclude(["shifting_price", "haulage_price"]))
+    )
 
-transfer_log_df = (
-    logistics_df.join(
+    transfer_log_lf: pl.LazyFrame = logistics_df.join(
         other=invoice_df,
         left_on=["Date", "Container Ref. No.", "Movement Type"],
-        right_on=[
-            "date",
-            "container_number",
-            "movement_type",
-        ],
-        how="full",
+        right_on=["date", "container_number", "movement_type"],
+        how="anti",
     )
-    .filter(pl.col("date").is_null())
-    .select(
-        pl.all().exclude(
-            [
-                "day_name",
-                "Check",
-                "date",
-                "container_number",
-                "line",
-                "movement_type",
-                "driver",
-                "origin",
-                "time_out",
-                "destination",
-                "time_in",
-                "status",
-                "type",
-                "size",
-                "remarks",
-            ]
-        )
-    )
-)
 
-transfer_inv_df = (
-    invoice_df.join(
-        other=logistics_df,
-        right_on=["Date", "Container Ref. No.", "Movement Type"],
-        left_on=["date", "container_number", "movement_type"],
-        how="full",
-    )
-    .filter(pl.col("Date").is_null(),pl.col("remarks").ne(pl.lit("CCCS")))
-    .select(
-        pl.all().exclude(
-            [
-                "Date",
-                "Container Ref. No.",
-                "Line/Client",
-                "Movement Type",
-                "Driver",
-                "From",
-                "Time out",
-                "Destination",
-                "Time in",
-                "Status",
-                "Type",
-                "Size",
-                "Remarks",
-            ]
+    # CCCS movements are not reconciled against the logistics record
+    transfer_inv_lf: pl.LazyFrame = (
+        invoice_df.filter(pl.col("remarks").ne(pl.lit("CCCS")))
+        .join(
+            other=logistics_df,
+            right_on=["Date", "Container Ref. No.", "Movement Type"],
+            left_on=["date", "container_number", "movement_type"],
+            how="anti",
         )
+        .sort(by=["date"])
     )
-    .sort(by=["date"])
-)
+
+    # Both sides share the logistics and invoice scans, so collect them together
+    return tuple(pl.collect_all([transfer_log_lf, transfer_inv_lf]))
+
+
+def transfer_log_df() -> pl.DataFrame:
+    """Transfer logistics records with no matching invoice line"""
+    return _difference_frames()[0]
+
+
+def transfer_inv_df() -> pl.DataFrame:
+    """Transfer invoice lines with no matching logistics record"""
+    return _difference_frames()[1]
@@ -8,10 +8,9 @@ from app.app import App
 
 pretty_errors.activate()
 
-async def main():
+def main():
     """main function"""
-    test = App()
-    await test.run()
+    asyncio.run(App().run())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
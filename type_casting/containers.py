@@ -6,7 +6,7 @@ providing type-safe enumerations and filtering capabilities for container types.
 """
 
 from typing import Optional, List, Dict, Any
-from functools import lru_cache
+import asyncio
 import logging
 
 import polars as pl
@@ -33,6 +33,11 @@ class ContainerManager:
     def __init__(self):
         """Initialize the ContainerManager with empty cache."""
         self._container_data: Optional[pl.LazyFrame] = None
+        self._details_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._containers_enum: Optional[pl.Enum] = None
+        self._containers_by_line: Dict[str, List[str]] = {}
+        # Builders await the containers concurrently; only the first one loads
+        self._load_lock = asyncio.Lock()
 
     async def _load_container_data(self, force_reload: bool = False) -> pl.LazyFrame:
         """
@@ -48,25 +53,32 @@ class ContainerManager:
             ConnectionError: If unable to connect to Google Sheets
             ValueError: If sheet data is missing required columns
         """
-        if self._container_data is None or force_reload:
-            try:
-                logger.info("Loading container data from sheet")
-                df = await load_gsheet_data(TRANSPORT_SHEET_ID, transfer_sheet)
-
-                # Validate required columns exist
-                required_columns = ["movement_type", "container_number", "line"]
-                available_columns = df.collect_schema().names()
-                missing_columns = [col for col in required_columns if col not in available_columns]
-
-                if missing_columns:
-                    raise ValueError(f"Sheet missing required columns: {missing_columns}")
-
-                # Filter out delivery records
-                self._container_data = df.filter(pl.col("movement_type") != "Delivery")
-
-            except Exception as e:
-                logger.error("Error loading container data: %s",{str(e)})
-                raise
+        async with self._load_lock:
+            if self._container_data is None or force_reload:
+                try:
+                    logger.info("Loading container data from sheet")
+                    df = await load_gsheet_data(TRANSPORT_SHEET_ID, transfer_sheet)
+
+                    # Validate required columns exist
+                    required_columns = ["movement_type", "container_number", "line"]
+                    available_columns = df.collect_schema().names()
+                    missing_columns = [col for col in required_columns if col not in available_columns]
+
+                    if missing_columns:
+                        raise ValueError(f"Sheet missing required columns: {missing_columns}")
+
+                    # Filter out delivery records once, so every lookup reads the
+                    # filtered rows from memory
+                    self._container_data = (
+                        df.filter(pl.col("movement_type") != "Delivery").collect().lazy()
+                    )
+                    self._details_index = None
+                    self._containers_enum = None
+                    self._containers_by_line = {}
+
+                except Exception as e:
+                    logger.error("Error loading container data: %s",{str(e)})
+                    raise
 
         return self._container_data
 
@@ -93,6 +105,8 @@ class ContainerManager:
             >>>     print(f"Processing {container}")
         """
         container_data = await self._load_container_data()
+        if self._containers_enum is not None:
+            return self._containers_enum
 
         try:
             container_list = (
@@ -100,12 +114,12 @@ class ContainerManager:
                 .select(pl.col("container_number").unique())
                 .collect()
                 .to_series()
-                .to_list()
             )
 
-            if not container_list:
+            if container_list.is_empty():
                 logger.warning("No containers found in data source")
-            return pl.Enum(container_list)
+            self._containers_enum = pl.Enum(container_list)
+            return self._containers_enum
 
         except Exception as e:
             logger.error("Error creating container enum: %s", {str(e)})
@@ -122,15 +136,16 @@ class ContainerManager:
             List of container numbers for the specified line
         """
         container_data = await self._load_container_data()
-
-        return (
-            container_data
-            .filter(pl.col("line").eq(pl.lit(line)))
-            .select(pl.col("container_number").unique())
-            .collect()
-            .to_series()
-            .to_list()
-        )
+        if line not in self._containers_by_line:
+            self._containers_by_line[line] = (
+                container_data
+                .filter(pl.col("line").eq(pl.lit(line)))
+                .select(pl.col("container_number").unique())
+                .collect()
+                .to_series()
+                .to_list()
+            )
+        return list(self._containers_by_line[line])
 
     async def get_iot_containers(self) -> List[str]:
         """
@@ -145,7 +160,6 @@ class ContainerManager:
         """
         return await self.get_containers_by_line("IOT")
 
-    @lru_cache(maxsize=32)
     async def get_container_details(self, container_number: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific container.
@@ -161,17 +175,17 @@ class ContainerManager:
         """
         container_data = await self._load_container_data()
 
-        container_info = (
-            container_data
-            .filter(pl.col("container_number") == container_number)
-            .collect()
-        )
+        # Index the first record of every container once, then look up by key
+        if self._details_index is None:
+            index: Dict[str, Dict[str, Any]] = {}
+            for row in container_data.collect().iter_rows(named=True):
+                index.setdefault(row["container_number"], row)
+            self._details_index = index
 
-        if container_info.height == 0:
+        if container_number not in self._details_index:
             raise ValueError(f"Container {container_number} not found")
 
-        # Convert first row to dict
-        return container_info.row(0).to_dict()
+        return dict(self._details_index[container_number])
 
 
 # Create singleton instance for easy import
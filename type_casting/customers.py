@@ -1,4 +1,6 @@
 """Customer Validations"""
+import asyncio
+from itertools import chain
 import polars as pl
 from data_source.make_dataset import load_gsheet_data
 from data_source.sheet_ids import MASTER_ID, client_sheet
@@ -6,37 +8,54 @@ from data_source.sheet_ids import MASTER_ID, client_sheet
 # Add a cache to avoid repeated data fetching
 _customer_cache = {}
 _customer_type_cache = {}
+_customer_lock = asyncio.Lock()
+
+# get_customer_by_type keys and the master sheet Type they are read from
+CUSTOMER_TYPES: dict[str, str] = {
+    "purseiner": "THONIER",
+    "longliner": "LONGLINER",
+    "cargo": "CARGO",
+    "supply_vessel": "SUPPLY VESSEL",
+    "military_vessel": "MILITARY VESSEL",
+    "tug_boat": "TUG BOAT",
+    "factory": "FACTORY",
+    "ship_owner_operator": "SHIP OWNER",
+    "agent": "AGENT",
+    "bycatch": "BYCATCH",
+    "various": "VARIOUS",
+    "hauler": "HAULAGE",
+    "shipping_line": "SHIPPING LINE",
+}
 
 async def enum_customer() -> pl.Enum:
     """Calls the master validation sheet and convert customer to an enum"""
     df = await load_gsheet_data(MASTER_ID, client_sheet)
     return pl.Enum(
-        df.select(pl.col("Vessel/Client").str.to_uppercase())
+        df.select(pl.col("Vessel/Client").str.to_uppercase().unique(maintain_order=True))
         .collect()
         .to_series()
-        .unique()
-        .to_list()
     )
 
-async def fetch_customers_by_type(customer_type: str) -> list[str]:
-    """Base function that fetches customers of a specific type without circular dependencies"""
-    # Check cache first
-    cache_key = f"customer_type_{customer_type}"
-    if cache_key in _customer_cache:
-        return _customer_cache[cache_key]
-    
-    # Fetch data if not in cache
+async def _load_customers_by_type() -> None:
+    """Splits the master sheet customers by type in one pass and caches every type"""
     df = await load_gsheet_data(MASTER_ID, client_sheet)
-    result = (
-        df.filter(pl.col("Type").eq(pl.lit(customer_type)))
-        .select(pl.col("Vessel/Client"))
+    grouped = (
+        df.select(pl.col("Type"), pl.col("Vessel/Client"))
         .collect()
-        .to_series()
-        .to_list()
+        .group_by("Type", maintain_order=True)
+        .agg(pl.col("Vessel/Client"))
     )
-    # Cache the result
-    _customer_cache[cache_key] = result
-    return result
+    for customer_type, clients in grouped.iter_rows():
+        _customer_cache[f"customer_type_{customer_type}"] = clients
+
+
+async def fetch_customers_by_type(customer_type: str) -> list[str]:
+    """Base function that fetches customers of a specific type without circular dependencies"""
+    # The whole sheet is split by type on first use
+    async with _customer_lock:
+        if not _customer_cache:
+            await _load_customers_by_type()
+    return list(_customer_cache.get(f"customer_type_{customer_type}", []))
 
 # Replace the old function with a wrapper around the base function
 async def customers(customer_type: str) -> list[str]:
@@ -62,22 +81,12 @@ async def get_customer_by_type() -> dict[str, list[str]]:
         return _customer_type_cache.copy()  # Return a copy to prevent modification
     
     # Build the dictionary using the base function
-    result = {
-        "purseiner": await fetch_customers_by_type("THONIER"),
-        "longliner": await fetch_customers_by_type("LONGLINER"),
-        "cargo": await fetch_customers_by_type("CARGO"),
-        "supply_vessel": await fetch_customers_by_type("SUPPLY VESSEL"),
-        "military_vessel": await fetch_customers_by_type("MILITARY VESSEL"),
-        "tug_boat": await fetch_customers_by_type("TUG BOAT"),
-        "factory": await fetch_customers_by_type("FACTORY"),
-        "ship_owner_operator": await fetch_customers_by_type("SHIP OWNER"),
-        "agent": await fetch_customers_by_type("AGENT"),
-        "bycatch": await fetch_customers_by_type("BYCATCH"),
-        "various": await fetch_customers_by_type("VARIOUS"),
-        "hauler": await fetch_customers_by_type("HAULAGE"),
-        # IOT is both a Factory and a Shipping Line per se.
-        "shipping_line": await fetch_customers_by_type("SHIPPING LINE") + ["IOT"],
-    }
+    customer_lists = await asyncio.gather(
+        *(fetch_customers_by_type(customer_type) for customer_type in CUSTOMER_TYPES.values())
+    )
+    result = dict(zip(CUSTOMER_TYPES, customer_lists))
+    # IOT is both a Factory and a Shipping Line per se.
+    result["shipping_line"] = result["shipping_line"] + ["IOT"]
 
     # Cache the result
     _customer_type_cache.update(result)
@@ -86,15 +95,16 @@ async def get_customer_by_type() -> dict[str, list[str]]:
 async def enum_vessel() -> pl.Enum:
     """To cast vessel name"""
     vessel = await get_customer_by_type()
-    df = (
-        vessel.get("purseiner")
-        + vessel.get("longliner")
-        + vessel.get("cargo")
-        + vessel.get("tug_boat")
-        + vessel.get("supply_vessel")
-        + vessel.get("military_vessel")
+    return list(
+        chain(
+            vessel.get("purseiner"),
+            vessel.get("longliner"),
+            vessel.get("cargo"),
+            vessel.get("tug_boat"),
+            vessel.get("supply_vessel"),
+            vessel.get("military_vessel"),
+        )
     )
-    return df
 
 # Client which handles shorecost when transporting fish in IPHS truck
 # We should move this somewhere else
@@ -104,16 +114,18 @@ client_shore_cost: list[str] = ["DARDANEL", "IOT"]
 async def shipper() -> list[str]:
     """Shippers"""
     customer = await get_customer_by_type()
-    return (
-        customer.get("agent")
-        + customer.get("ship_owner_operator")
-        + customer.get("shipping_line")
-        + customer.get("bycatch")
-        + [
-            "IOT EXPORT",
-            "CCCS",
-            "IPHS",
-            # "ALBACORA SA",
-            # "INPESCA SA",
-        ]
+    return list(
+        chain(
+            customer.get("agent"),
+            customer.get("ship_owner_operator"),
+            customer.get("shipping_line"),
+            customer.get("bycatch"),
+            [
+                "IOT EXPORT",
+                "CCCS",
+                "IPHS",
+                # "ALBACORA SA",
+                # "INPESCA SA",
+            ],
+        )
     )
@@ -12,6 +12,7 @@ This module provides utilities for working with dates, including:
 
 from datetime import date, datetime, timedelta, time
 from enum import Enum
+from functools import lru_cache
 from typing import Literal, List, Optional, Union, Tuple
 import polars as pl
 # from dateutil.relativedelta import relativedelta
@@ -38,7 +39,13 @@ DateRange = Tuple[date, date]
 UPPER_BOUND_SPECIAL_DAY: time = time(16, 0, 0)
 UPPER_BOUND: time = time(17, 0, 0)
 MORNING_CUTOFF: time = time(7, 59, 0)
-NULL_DURATION = pl.duration(hours=0, minutes=0, seconds=0)
+# A zero Duration literal, broadcast as a scalar rather than built per frame
+NULL_DURATION: pl.Expr = pl.lit(timedelta(0), dtype=pl.Duration("us"))
+
+# Same cut-offs as seconds since midnight, for interval arithmetic
+SECONDS_IN_A_DAY: int = 86_400
+UPPER_BOUND_SPECIAL_DAY_SECONDS: int = UPPER_BOUND_SPECIAL_DAY.hour * 3_600
+UPPER_BOUND_SECONDS: int = UPPER_BOUND.hour * 3_600
 
 
 def duration_to_hhmm(
@@ -56,16 +63,14 @@ def duration_to_hhmm(
     Returns:
         DataFrame or LazyFrame with duration columns converted to HH:MM format
     """
-    # Determine if we're working with a DataFrame or LazyFrame
-    is_lazy = isinstance(df, pl.LazyFrame)
-    schema = df.schema if not is_lazy else df.collect_schema()
-
-    # If no duration columns specified, detect them automatically
+    # If no duration columns specified, detect them automatically; the schema
+    # is only resolved here, as the caller already named the columns otherwise
     if duration_columns is None:
+        schema = df.collect_schema()
         duration_columns = [
             col_name
             for col_name, dtype in schema.items()
-            if str(dtype).startswith("duration")
+            if isinstance(dtype, pl.Duration)
         ]
     elif isinstance(duration_columns, str):
         duration_columns = [duration_columns]
@@ -74,21 +79,17 @@ def duration_to_hhmm(
     if not duration_columns:
         return df
 
-    # Define a function to format durations as HH:MM
-    def format_as_hhmm(s: pl.Series) -> pl.Series:
-        return s.map_elements(
-            lambda d: f"""{int(d.total_seconds()
-            // 3600):02d}:{int((d.total_seconds() % 3600) // 60):02d}"""
-            if d is not None
-            else None,
-            return_dtype=pl.Utf8,
-        )
-
-    # Apply the conversion to each duration column
-    for col in duration_columns:
-        df = df.with_columns(format_as_hhmm(pl.col(col)).alias(col))
+    # Format durations as HH:MM natively, so no Python call is made per row
+    def format_as_hhmm(col: str) -> pl.Expr:
+        seconds = pl.col(col).dt.total_seconds()
+        return pl.format(
+            "{}:{}",
+            (seconds // 3600).cast(pl.Utf8).str.zfill(2),
+            ((seconds % 3600) // 60).cast(pl.Utf8).str.zfill(2),
+        ).alias(col)
 
-    return df
+    # Convert every column in a single pass
+    return df.with_columns(format_as_hhmm(col) for col in duration_columns)
 
 
 class Year(int):
@@ -190,11 +191,11 @@ class Year(int):
         return start_date, end_date
 
 
-# Date constants
+# Date constants, fixed at import; defaults that must follow the clock
+# (e.g. in long-running processes) resolve Year.current() at call time
 CURRENT_DATE: date = datetime.now().date()
 CURRENT_YEAR: Year = Year(CURRENT_DATE.year)
-START_OF_YEAR: date = Year.date_range(CURRENT_YEAR)[0]
-END_OF_YEAR: date = Year.date_range(CURRENT_YEAR)[1]
+START_OF_YEAR, END_OF_YEAR = Year.date_range(CURRENT_YEAR)
 
 
 class Month(Enum):
@@ -260,7 +261,7 @@ class Month(Enum):
         Returns:
             int: The corresponding month number (1-12)
         """
-        return cls[name.upper()].value
+        return MONTH_NUMBERS[name.upper()]
 
     @classmethod
     def get_all_names(cls) -> List[str]:
@@ -309,7 +310,7 @@ class Month(Enum):
         Returns:
             Month: The next month
         """
-        return Month.from_number(1 if self.value == 12 else self.value + 1)
+        return Month(self.value % 12 + 1)
 
     def previous_month(self) -> "Month":
         """
@@ -318,7 +319,13 @@ class Month(Enum):
         Returns:
             Month: The previous month
         """
-        return Month.from_number(12 if self.value == 1 else self.value - 1)
+        return Month((self.value - 2) % 12 + 1)
+
+
+# Capitalised month names, indexed by month number - 1
+MONTH_NAMES: Tuple[str, ...] = tuple(month.name.capitalize() for month in Month)
+# Month number for each upper case month name
+MONTH_NUMBERS: dict[str, int] = {month.name: month.value for month in Month}
 
 
 class DayName(Enum):
@@ -381,7 +388,7 @@ class DayName(Enum):
         Returns:
             bool: True if the day is a weekend day, False otherwise
         """
-        return day in [cls.SAT.value, cls.SUN.value]
+        return day in WEEKEND_DAY_SET
 
     @classmethod
     def is_special_day(cls, day: str) -> bool:
@@ -394,7 +401,7 @@ class DayName(Enum):
         Returns:
             bool: True if the day is a special day, False otherwise
         """
-        return day in [cls.PH.value, cls.SUN.value]
+        return day in SPECIAL_DAY_SET
 
     @classmethod
     def get_weekdays(cls) -> List[str]:
@@ -404,22 +411,20 @@ class DayName(Enum):
         Returns:
             List[str]: List of weekday names
         """
-        return [
-            member.value for member in [cls.MON, cls.TUE, cls.WED, cls.THU, cls.FRI]
-        ]
+        return list(BUSINESS_DAY_NAMES)
 
     @staticmethod
-    def __get_public_holidays(year: Union[Year, int]) -> List[date]:
+    @lru_cache(maxsize=64)
+    def __get_public_holidays(year_int: int) -> frozenset[date]:
         """
-        Get a list of public holidays for a given year.
+        Get the public holidays for a given year, computed once per year.
 
         Args:
-            year (Union[Year, int]): The year for which to get the public holidays.
+            year_int (int): The year for which to get the public holidays.
 
         Returns:
-            List[date]: A list of dates representing public holidays for the given year.
+            frozenset[date]: The dates of the public holidays for the given year.
         """
-        year_int = int(year)
         public_holidays = []
 
         # Add fixed public holidays
@@ -457,14 +462,18 @@ class DayName(Enum):
         public_holidays.append(corpus_christi_date)
 
         # Check if a fixed holiday falls on a Sunday and add the following Monday
-        for holiday in fixed_holidays:
-            if holiday.weekday() == 6:  # Sunday
-                public_holidays.append(holiday + timedelta(days=1))
+        public_holidays.extend(
+            holiday + timedelta(days=1)
+            for holiday in fixed_holidays
+            if holiday.weekday() == 6  # Sunday
+        )
 
-        return sorted(public_holidays)
+        return frozenset(public_holidays)
 
     @classmethod
-    def get_public_holidays(cls, year: Union[Year, int] = CURRENT_YEAR) -> List[date]:
+    def get_public_holidays(
+        cls, year: Optional[Union[Year, int]] = None
+    ) -> List[date]:
         """
         Get a list of public holidays for a given year.
 
@@ -474,10 +483,13 @@ class DayName(Enum):
         Returns:
             List[date]: List of public holiday dates for the specified year
         """
-        return cls.__get_public_holidays(year)
+        year = Year.current() if year is None else year
+        return sorted(cls.__get_public_holidays(int(year)))
 
     @classmethod
-    def public_holiday_series(cls, year: Union[Year, int] = CURRENT_YEAR) -> List[date]:
+    def public_holiday_series(
+        cls, year: Optional[Union[Year, int]] = None
+    ) -> List[date]:
         """
         Gets the public holidays for 3 years (previous, current, and next) as a Polars Series.
 
@@ -487,24 +499,16 @@ class DayName(Enum):
         Returns:
             pl.Series: A Polars Series containing all public holiday dates sorted
         """
-        year_int = int(year)
-        previous_year = year_int - 1
-        current_year = year_int
-        next_year = year_int + 1
-
-        return (
-            pl.Series(
-                cls.__get_public_holidays(previous_year)
-                + cls.__get_public_holidays(current_year)
-                + cls.__get_public_holidays(next_year)
-            )
-            .sort()
-            .to_list()
+        year_int = int(Year.current() if year is None else year)
+        return sorted(
+            cls.__get_public_holidays(year_int - 1)
+            | cls.__get_public_holidays(year_int)
+            | cls.__get_public_holidays(year_int + 1)
         )
 
     @classmethod
     def is_public_holiday(
-        cls, date_to_check: date, year: Union[Year, int] = CURRENT_YEAR
+        cls, date_to_check: date, year: Optional[Union[Year, int]] = None
     ) -> bool:
         """
         Check if a specific date is a public holiday.
@@ -516,8 +520,8 @@ class DayName(Enum):
         Returns:
             bool: True if the date is a public holiday, False otherwise
         """
-        holidays = cls.__get_public_holidays(year)
-        return date_to_check in holidays
+        year = Year.current() if year is None else year
+        return date_to_check in cls.__get_public_holidays(int(year))
 
 
 class DateCalculator:
@@ -541,7 +545,7 @@ class DateCalculator:
             bool: True if the date is a business day, False otherwise
         """
         # Not a weekend and not a public holiday
-        return d.weekday() < 5 and not DayName.is_public_holiday(d)
+        return d.weekday() < 5 and not DayName.is_public_holiday(d, d.year)
 
     @staticmethod
     def next_business_day(d: date) -> date:
@@ -615,17 +619,23 @@ class DateCalculator:
             (inclusive of start_date, exclusive of end_date)
         """
         if start_date > end_date:
-            return -DateCalculator.business_days_between(start_date, end_date)
+            return -DateCalculator.business_days_between(end_date, start_date)
 
-        count = 0
-        current = start_date
+        # Count weekdays a week at a time, then walk the remaining few days
+        full_weeks, extra_days = divmod((end_date - start_date).days, 7)
+        weekdays = full_weeks * 5 + sum(
+            1 for offset in range(extra_days) if (start_date.weekday() + offset) % 7 < 5
+        )
 
-        while current < end_date:
-            if DateCalculator.is_business_day(current):
-                count += 1
-            current += timedelta(days=1)
+        # Take off the public holidays that fall on a weekday in the range
+        holidays = sum(
+            1
+            for year in range(start_date.year, end_date.year + 1)
+            for holiday in DayName.get_public_holidays(year)
+            if start_date <= holiday < end_date and holiday.weekday() < 5
+        )
 
-        return count
+        return weekdays - holidays
 
     @staticmethod
     def business_month_end(year: Union[Year, int], month: int) -> date:
@@ -698,14 +708,7 @@ class DateRangeGenerator:
         if start_date > end_date:
             return []
 
-        result = []
-        current = start_date
-
-        while current <= end_date:
-            result.append(current)
-            current += timedelta(days=1)
-
-        return result
+        return pl.date_range(start_date, end_date, "1d", eager=True).to_list()
 
     @staticmethod
     def create_business_day_sequence(start_date: date, end_date: date) -> List[date]:
@@ -719,11 +722,16 @@ class DateRangeGenerator:
         Returns:
             List[date]: The sequence of business days
         """
-        return [
-            d
-            for d in DateRangeGenerator.create_date_sequence(start_date, end_date)
-            if DateCalculator.is_business_day(d)
+        dates = pl.date_range(start_date, end_date, "1d", eager=True)
+        holidays = [
+            holiday
+            for year in range(start_date.year, end_date.year + 1)
+            for holiday in DayName.get_public_holidays(year)
         ]
+        # Weekdays run from 1 (Monday) to 7 (Sunday)
+        return dates.filter(
+            (dates.dt.weekday() <= 5) & ~dates.is_in(holidays)
+        ).to_list()
 
     @staticmethod
     def create_weekly_table(year: Union[Year, int]) -> pl.DataFrame:
@@ -731,10 +739,9 @@ class DateRangeGenerator:
         Creates a weekly table for a given year.
 
         This function generates a Polars DataFrame containing a weekly breakdown for the year.
+        Weeks run Monday to Sunday and are cut at the start and end of the year.
         The DataFrame includes columns for:
-        - date: The date for each day within the year.
-        - day_of_year: The day of the year (cumulative count starting from 1).
-        - week_num: The corresponding week number for each date.
+        - week_num: The number of the week within the year, starting from 1.
         - start_date: The starting date of the week (minimum date within the week).
         - end_date: The ending date of the week (maximum date within the week).
 
@@ -747,25 +754,22 @@ class DateRangeGenerator:
         year_int = int(year)
         start, end = Year.date_range(year_int)
 
+        # One row per Monday from the week holding 1 January, with each week
+        # then cut back to the year; ISO week numbers wrap around at the ends
+        # of the year, so weeks are numbered in order instead
+        first_monday = start - timedelta(days=start.weekday())
+
         return (
-            pl.datetime_range(start=start, end=end, interval="1d", eager=True)
-            .dt.date()
-            .alias("date")
+            pl.date_range(start=first_monday, end=end, interval="1w", eager=True)
+            .alias("week_start")
             .to_frame()
-            .with_columns(day_of_year=pl.col("date").cum_count().add(1))
-            .with_columns(
-                week_num=pl.when(pl.col("date").dt.weekday() == 0)
-                .then(pl.col("day_of_year"))
-                .otherwise(pl.col("day_of_year").floordiv(7) + 1)
-                .cast(pl.Int32)
+            .select(
+                pl.int_range(1, pl.len() + 1, dtype=pl.Int32).alias("week_num"),
+                pl.col("week_start").clip(lower_bound=start).alias("start_date"),
+                (pl.col("week_start") + timedelta(days=6))
+                .clip(upper_bound=end)
+                .alias("end_date"),
             )
-            .filter(pl.col("date") >= start)
-            .group_by("week_num")
-            .agg(
-                pl.col("date").min().alias("start_date"),
-                pl.col("date").max().alias("end_date"),
-            )
-            .sort(by="week_num")
         )
 
     @staticmethod
@@ -782,7 +786,15 @@ class DateRangeGenerator:
             pl.DataFrame: A Polars DataFrame containing the monthly breakdown information.
         """
         year_int = int(year)
-        months = []
+        # One list per column, so the frame is built column by column
+        columns: dict[str, list] = {
+            "month": [],
+            "month_name": [],
+            "start_date": [],
+            "end_date": [],
+            "business_end_date": [],
+            "days_in_month": [],
+        }
 
         for month in range(1, 13):
             start_date = date(year_int, month, 1)
@@ -792,24 +804,31 @@ class DateRangeGenerator:
             else:
                 end_date = date(year_int, month + 1, 1) - timedelta(days=1)
 
-            business_end = DateCalculator.business_month_end(year_int, month)
-
-            months.append(
-                {
-                    "month": month,
-                    "month_name": Month(month).name.capitalize(),
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "business_end_date": business_end,
-                    "days_in_month": (end_date - start_date).days + 1,
-                }
+            columns["month"].append(month)
+            columns["month_name"].append(MONTH_NAMES[month - 1])
+            columns["start_date"].append(start_date)
+            columns["end_date"].append(end_date)
+            columns["business_end_date"].append(
+                DateCalculator.business_month_end(year_int, month)
             )
-
-        return pl.DataFrame(months)
+            columns["days_in_month"].append((end_date - start_date).days + 1)
+
+        # The schema is fixed, so it is given rather than inferred
+        return pl.DataFrame(
+            columns,
+            schema={
+                "month": pl.Int64,
+                "month_name": pl.String,
+                "start_date": pl.Date,
+                "end_date": pl.Date,
+                "business_end_date": pl.Date,
+                "days_in_month": pl.Int64,
+            },
+        )
 
     @staticmethod
     def month_range(
-        month_name: str, year: Union[Year, int] = CURRENT_YEAR
+        month_name: str, year: Optional[Union[Year, int]] = None
     ) -> DateRange:
         """
         Calculates the start and end date of a given month within a specified year.
@@ -821,8 +840,8 @@ class DateRangeGenerator:
         Returns:
             DateRange: A tuple containing the start and end date of the month.
         """
-        month_number: int = Month.to_number(month_name)
-        return Month(month_number).date_range(year)
+        year = Year.current() if year is None else year
+        return Month.from_name(month_name).date_range(year)
 
 
 # Common date utility functions
@@ -853,6 +872,20 @@ def date_range(start_date: date, end_date: date) -> DateRange:
     return start_date, end_date
 
 
+def weekday_name(date_col: pl.Expr) -> pl.Expr:
+    """
+    Abbreviated day name (Mon, Tue, etc.) of a date expression, looked up
+    from the weekday number instead of formatting each date with strftime.
+
+    Args:
+        date_col (pl.Expr): A pl.Date expression
+
+    Returns:
+        pl.Expr: A string expression with the day name
+    """
+    return date_col.dt.weekday().replace_strict(WEEKDAY_NAMES, return_dtype=pl.String)
+
+
 def get_age(birth_date: date, reference_date: Optional[date] = None) -> int:
     """
     Calculate age in years given a birth date and reference date.
@@ -864,7 +897,7 @@ def get_age(birth_date: date, reference_date: Optional[date] = None) -> int:
     Returns:
         int: The age in years
     """
-    reference = reference_date or CURRENT_DATE
+    reference = reference_date or datetime.now().date()
 
     years = reference.year - birth_date.year
 
@@ -877,8 +910,41 @@ def get_age(birth_date: date, reference_date: Optional[date] = None) -> int:
 
 # Constants for day names
 DAY_NAMES: List[str] = DayName.get_all()
+DAY_NAME_ENUM: pl.Enum = pl.Enum(DAY_NAMES)
 CALENDAR_DAY_NAMES: List[str] = DayName.get_calendar_days()
 SPECIAL_DAYS: List[str] = DayName.get_special_days()
+BUSINESS_DAY_NAMES: Tuple[str, ...] = tuple(
+    day.value for day in (DayName.MON, DayName.TUE, DayName.WED, DayName.THU, DayName.FRI)
+)
+
+# Sets for the DayName membership checks
+WEEKEND_DAY_SET: frozenset[str] = frozenset({DayName.SAT.value, DayName.SUN.value})
+SPECIAL_DAY_SET: frozenset[str] = frozenset(SPECIAL_DAYS)
+
+# Abbreviated day name for each ISO weekday number (Mon = 1)
+WEEKDAY_NAMES: dict[int, str] = {
+    number: day.value
+    for number, day in enumerate(
+        [
+            DayName.MON,
+            DayName.TUE,
+            DayName.WED,
+            DayName.THU,
+            DayName.FRI,
+            DayName.SAT,
+            DayName.SUN,
+        ],
+        start=1,
+    )
+}
+
+# Public holidays (previous, current and next year), sorted, for is_in lookups.
+# Kept as a list: is_in against a Series of the same dtype is deprecated
+PUBLIC_HOLIDAYS: List[date] = DayName.public_holiday_series()
+
+# Longest run of weekend days and public holidays (Good Friday to Easter
+# Monday), so the nearest business day is always within one more day
+MAX_NON_BUSINESS_DAYS: int = 4
 
 
 @pl.api.register_expr_namespace("days")
@@ -912,11 +978,11 @@ class Days:
         """
         return (
             (
-                pl.when(self._expr.is_in(DayName.public_holiday_series()))
+                pl.when(self._expr.is_in(PUBLIC_HOLIDAYS))
                 .then(pl.lit(DayName.PH.value))
                 .otherwise(self._expr.dt.to_string(format="%a"))
             )
-            .cast(dtype=pl.Enum(DAY_NAMES))
+            .cast(dtype=DAY_NAME_ENUM)
             .alias("day_name")
         )
 
@@ -927,7 +993,8 @@ class Days:
         Returns:
             pl.Expr: A boolean expression that is True for weekends, False otherwise.
         """
-        return self._expr.dt.weekday().is_in([5, 6]).alias("is_weekend")
+        # Polars weekdays run from 1 (Monday) to 7 (Sunday)
+        return self._expr.dt.weekday().is_in([6, 7]).alias("is_weekend")
 
     def is_public_holiday(self) -> pl.Expr:
         """
@@ -936,7 +1003,7 @@ class Days:
         Returns:
             pl.Expr: A boolean expression that is True for public holidays, False otherwise.
         """
-        return self._expr.is_in(DayName.public_holiday_series()).alias(
+        return self._expr.is_in(PUBLIC_HOLIDAYS).alias(
             "is_public_holiday"
         )
 
@@ -973,11 +1040,7 @@ class Days:
         Returns:
             pl.Expr: Date expression for the next business day
         """
-        return (
-            pl.struct([self._expr])
-            .map_elements(lambda x: DateCalculator.next_business_day(x[0]))
-            .alias("next_business_day")
-        )
+        return self._nearest_business_day(1).alias("next_business_day")
 
     def previous_business_day(self) -> pl.Expr:
         """
@@ -986,8 +1049,25 @@ class Days:
         Returns:
             pl.Expr: Date expression for the previous business day
         """
-        return (
-            pl.struct([self._expr])
-            .map_elements(lambda x: DateCalculator.previous_business_day(x[0]))
-            .alias("previous_business_day")
+        return self._nearest_business_day(-1).alias("previous_business_day")
+
+    def _nearest_business_day(self, step: int) -> pl.Expr:
+        """
+        First business day found stepping away from the date, one day at a time.
+
+        Args:
+            step (int): 1 to look forward, -1 to look backward
+
+        Returns:
+            pl.Expr: Date expression for the nearest business day in that direction
+        """
+        candidates = [
+            self._expr + timedelta(days=step * offset)
+            for offset in range(1, MAX_NON_BUSINESS_DAYS + 2)
+        ]
+        return pl.coalesce(
+            [
+                pl.when(Days(candidate).is_business_day()).then(candidate)
+                for candidate in candidates
+            ]
         )
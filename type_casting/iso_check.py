@@ -1,5 +1,40 @@
 """iso check for container numbers"""
-import re
+
+import polars as pl
+
+# ISO 6346 value of every character that can appear before the check digit
+CHAR_VALUES: dict[str, int] = {
+    "A": 10,
+    "B": 12,
+    "C": 13,
+    "D": 14,
+    "E": 15,
+    "F": 16,
+    "G": 17,
+    "H": 18,
+    "I": 19,
+    "J": 20,
+    "K": 21,
+    "L": 23,
+    "M": 24,
+    "N": 25,
+    "O": 26,
+    "P": 27,
+    "Q": 28,
+    "R": 29,
+    "S": 30,
+    "T": 31,
+    "U": 32,
+    "V": 34,
+    "W": 35,
+    "X": 36,
+    "Y": 37,
+    "Z": 38,
+    **{str(digit): digit for digit in range(10)},
+}
+
+# Weight of each of the first ten characters
+POWERS: tuple[int, ...] = tuple(1 << i for i in range(10))
 
 
 class ContainerValidator:
@@ -10,25 +45,27 @@ class ContainerValidator:
 
     def read_input(self, data: list[str] = None):
         """Reads the container numbers"""
-        if data:
-            container_numbers = data
-            return [number.strip() for number in container_numbers]
-        container_numbers = input(
-            "Enter container numbers separated by commas: ").split(',')
-        return [number.strip() for number in container_numbers]
+        if not data:
+            data = input("Enter container numbers separated by commas: ").split(",")
+        return [number.strip() for number in data]
 
 
     def validate_container_number(self,container_number:list[str]):
         """validates the container numbers"""
 
-        pattern = re.compile(r"[A-Z]{4}[0-9]{6}[0-9]$")
-
         try:
             if len(container_number) != 11:
                 raise ValueError(
                     f"Container number '{container_number} is not 11 characters long."
                 )
-            if not pattern.match(container_number):
+            # Four capital letters, then six serial digits and the check digit
+            owner_code, digits = container_number[:4], container_number[4:]
+            if not (
+                container_number.isascii()
+                and owner_code.isalpha()
+                and owner_code.isupper()
+                and digits.isdigit()
+            ):
                 raise ValueError(
                     f"Container number '{container_number}' does not match the required format."
                 )
@@ -44,41 +81,9 @@ class ContainerValidator:
 
     def validate_check_digit(self, container_number) -> bool:
         """Calculates the check digit"""
-        value_map: dict[str, int] = {
-            "A": 10,
-            "B": 12,
-            "C": 13,
-            "D": 14,
-            "E": 15,
-            "F": 16,
-            "G": 17,
-            "H": 18,
-            "I": 19,
-            "J": 20,
-            "K": 21,
-            "L": 23,
-            "M": 24,
-            "N": 25,
-            "O": 26,
-            "P": 27,
-            "Q": 28,
-            "R": 29,
-            "S": 30,
-            "T": 31,
-            "U": 32,
-            "V": 34,
-            "W": 35,
-            "X": 36,
-            "Y": 37,
-            "Z": 38,
-        }
-
-        total_sum = 0
-        for i in range(10):
-            if i < 4:
-                total_sum += value_map[container_number[i]] * (2**i)
-            else:
-                total_sum += int(container_number[i]) * (2**i)
+        total_sum = sum(
+            CHAR_VALUES[char] * power for char, power in zip(container_number, POWERS)
+        )
 
         check_digit = total_sum % 11
         check_digit %= 10
@@ -95,3 +100,49 @@ class ContainerValidator:
                 print(f"Container Number: '{cnumber}' is invalid")
             else:
                 print("all okay!")
+
+
+@pl.api.register_expr_namespace("container")
+class Container:
+    """
+    Creates the container namespace for Polars expressions.
+
+    This class validates whole columns of container numbers in Polars,
+    using the same rules as ContainerValidator.
+    """
+
+    def __init__(self, expr: pl.Expr) -> None:
+        """
+        Initialize the Container namespace with a Polars expression.
+
+        Args:
+            expr (pl.Expr): The Polars expression holding the container numbers
+        """
+        self._expr = expr
+
+    def is_valid(self) -> pl.Expr:
+        """
+        Checks the format and the check digit of each container number.
+
+        Returns:
+            pl.Expr: A boolean expression that is True for valid container numbers,
+            False otherwise (including nulls).
+        """
+        # Characters that are not in the table give nulls, which fail below
+        total_sum = sum(
+            self._expr.str.slice(i, 1).replace_strict(
+                CHAR_VALUES, default=None, return_dtype=pl.Int64
+            )
+            * power
+            for i, power in enumerate(POWERS)
+        )
+        check_digit = self._expr.str.slice(10, 1).cast(pl.Int64, strict=False)
+
+        return (
+            (
+                self._expr.str.contains(r"^[A-Z]{4}[0-9]{7}$")
+                & (total_sum % 11 % 10).eq(check_digit)
+            )
+            .fill_null(False)
+            .alias("is_valid")
+        )